@@ -22,6 +22,7 @@ from datetime import datetime
 from functools import partial
 import queue
 import io
+import collections
 
 # For system tray functionality
 PYSTRAY_AVAILABLE = False
@@ -49,10 +50,10 @@ except ImportError:
 # NOTE: In a production environment, these imports would be from a deployed package.
 # For this script, we assume the directory structure allows these relative imports to work.
 try:
-    from .core.rgb_color import RGBColor
+    from .core.rgb_color import RGBColor, HUE_WHEEL, HUE_WHEEL_STEPS
     from .core.settings import SettingsManager
     from .core.constants import (
-        NUM_ZONES, LEDS_PER_ZONE, TOTAL_LEDS,
+        NUM_ZONES, LEDS_PER_ZONE, TOTAL_LEDS, ZONE_GRADIENT_RATIOS,
         PREVIEW_WIDTH, PREVIEW_HEIGHT, PREVIEW_LED_SIZE,
         PREVIEW_LED_SPACING, PREVIEW_KEYBOARD_COLOR,
         ANIMATION_FRAME_DELAY, APP_NAME, VERSION,
@@ -67,6 +68,28 @@ except ImportError as e:
     print(f"FATAL ERROR: Could not import core modules. Ensure you are running this script as a package with 'python -m your_package_name'. Error: {e}", file=sys.stderr)
     sys.exit(1)
 
+# Effect-name groups tested on every effect start/stop/restore; built once
+_STATIC_EFFECT_NAMES = frozenset({"Static Color", "Static Zone Colors", "Static Rainbow", "Static Gradient"})
+_REACTIVE_EFFECT_NAMES = frozenset({"Reactive", "Anti-Reactive"})
+
+# Shared dark colour / zone frame for blanking the preview. RGBColor is never modified
+# in place, so zone_colors can hold these instead of a fresh object per zone per frame.
+_BLACK = RGBColor(0, 0, 0)
+_BLACK_ZONES = (_BLACK,) * NUM_ZONES
+
+# Canvas tag carried by every preview key rectangle of a zone, so one itemconfig
+# recolours the whole zone
+_PREVIEW_ZONE_TAGS = tuple(f'zone{i}' for i in range(NUM_ZONES))
+
+# Scripted key presses for the reactive/anti-reactive previews: (row, col) keys in
+# the preview key grid, pressed in turn from start_frame (200-frame cycle)
+_PREVIEW_TYPING_PATTERNS = (
+    {'keys': ((1, 5), (1, 6), (1, 7), (1, 7), (1, 8)), 'start_frame': 0, 'duration': 15},
+    {'keys': ((2, 1), (1, 1), (2, 2), (2, 0)), 'start_frame': 50, 'duration': 20},
+    {'keys': ((4, 7),), 'start_frame': 100, 'duration': 8},
+    {'keys': ((4, 12), (4, 13), (4, 14), (4, 15)), 'start_frame': 150, 'duration': 12},
+)
+
 # --- Placeholder Classes to resolve NameError ---
 class PerformanceMonitor:
     """A placeholder class for monitoring application performance."""
@@ -117,6 +140,9 @@ class RGBControllerGUI:
         self.is_fullscreen = False
         self.preview_animation_active = False
         self.preview_animation_id: Optional[str] = None
+        self._preview_next_due = 0.0 # time.monotonic() deadline of the next preview frame
+        self._preview_redraw_pending = False # An after_idle preview redraw is already queued
+        self._preview_paused = False # Window unmapped (minimized/in tray): preview frames are skipped
         self._preview_frame_count = 0
         self._loading_settings = False
         self.tray_icon: Optional[pystray.Icon] = None
@@ -169,11 +195,12 @@ class RGBControllerGUI:
             else:
                 self.logger.warning("hardware.attempt_stop_hardware_effects not found, falling back to clear_all_leds.")
                 self.hardware.clear_all_leds()
-        self.zone_colors = [RGBColor(0,0,0)] * NUM_ZONES
-        self.update_preview_keyboard()
+        self.zone_colors[:] = _BLACK_ZONES
+        self._schedule_preview_redraw()
         self.logger.debug("All visuals stopped and hardware clear attempted.")
 
     def setup_logging(self) -> logging.Logger:
+        self._log_listener: Optional[logging.handlers.QueueListener] = None
         logger = logging.getLogger(f"{APP_NAME}.GUI")
         if logger.hasHandlers(): return logger
         logger.setLevel(logging.DEBUG)
@@ -185,7 +212,12 @@ class RGBControllerGUI:
             fh = logging.handlers.RotatingFileHandler(log_file, maxBytes=5*1024*1024, backupCount=3, encoding='utf-8')
             fh.setLevel(logging.DEBUG)
             fh.setFormatter(formatter)
-            logger.addHandler(fh)
+            # Logging calls (including from effect/hardware threads) only enqueue the record;
+            # the listener thread does the formatting, rotation and disk writes.
+            log_queue: queue.Queue = queue.Queue(-1)
+            self._log_listener = logging.handlers.QueueListener(log_queue, fh, respect_handler_level=True)
+            self._log_listener.start()
+            logger.addHandler(logging.handlers.QueueHandler(log_queue))
         except (IOError, PermissionError) as e:
             logger.error(f"Failed to set up GUI file logging: {e}", exc_info=True)
         return logger
@@ -291,6 +323,11 @@ Note: Global hotkeys require elevated privileges to capture system-wide key even
                 self.logger.info("Reactive effects: Hardware EC key detection available")
         self.logger.info(f"Reactive effects: Available detection methods: {self.reactive_detection_methods}")
 
+    def _preview_itemconfig(self) -> Callable[..., Any]:
+        """itemconfig of the main preview canvas, or a no-op before it exists."""
+        canvas = getattr(self, 'preview_canvas', None)
+        return canvas.itemconfig if canvas is not None else (lambda *args, **kwargs: None)
+
     def preview_reactive(self, frame_count: int):
         """Preview reactive effect - keys light up only when pressed"""
         try:
@@ -299,8 +336,7 @@ Note: Global hotkeys require elevated privileges to capture system-wide key even
             base_color_rgb = RGBColor(255, 255, 255)
         is_rainbow = self.effect_rainbow_mode_var.get()
         speed_multiplier = self.get_hardware_synchronized_speed()
-        for i in range(NUM_ZONES):
-            self.zone_colors[i] = RGBColor(0, 0, 0)
+        self.zone_colors[:] = _BLACK_ZONES
         if hasattr(self, 'key_grid') and self.key_grid:
             self._simulate_realistic_key_presses_for_reactive_preview(frame_count, base_color_rgb, is_rainbow)
         else:
@@ -311,21 +347,15 @@ Note: Global hotkeys require elevated privileges to capture system-wide key even
         """Simulate realistic typing patterns for reactive preview"""
         if not hasattr(self, 'key_grid') or not self.key_grid:
             return
+        itemconfig = self._preview_itemconfig() # Looked up once per frame, not per key
         for row in self.key_grid:
             for key_info in row:
                 try:
-                    canvas = self.preview_canvas
-                    canvas.itemconfig(key_info['element'], fill='#404040', outline='#606060', width=1)
+                    itemconfig(key_info['element'], fill='#404040', outline='#606060', width=1)
                 except:
                     pass
-        typing_patterns = [
-            {'keys': [(1, 5), (1, 6), (1, 7), (1, 7), (1, 8)], 'start_frame': 0, 'duration': 15},
-            {'keys': [(2, 1), (1, 1), (2, 2), (2, 0)], 'start_frame': 50, 'duration': 20},
-            {'keys': [(4, 7)], 'start_frame': 100, 'duration': 8},
-            {'keys': [(4, 12), (4, 13), (4, 14), (4, 15)], 'start_frame': 150, 'duration': 12},
-        ]
         active_keys = set()
-        for pattern in typing_patterns:
+        for pattern in _PREVIEW_TYPING_PATTERNS:
             pattern_frame = (frame_count - pattern['start_frame']) % 200
             if 0 <= pattern_frame < pattern['duration']:
                 for i, (row, col) in enumerate(pattern['keys']):
@@ -338,13 +368,11 @@ Note: Global hotkeys require elevated privileges to capture system-wide key even
                 key_info = self.key_grid[row][col]
                 if is_rainbow:
                     hue = ((row + col) / 10 + frame_count * 0.01) % 1.0
-                    rgb_float = colorsys.hsv_to_rgb(hue, 1.0, 1.0)
-                    color = RGBColor(int(rgb_float[0] * 255), int(rgb_float[1] * 255), int(rgb_float[2] * 255))
+                    color = HUE_WHEEL[int(hue * HUE_WHEEL_STEPS) % HUE_WHEEL_STEPS]
                 else:
                     color = base_color
                 try:
-                    canvas = self.preview_canvas
-                    canvas.itemconfig(key_info['element'], fill=color.to_hex(), outline='#ffffff', width=2)
+                    itemconfig(key_info['element'], fill=color.to_hex(), outline='#ffffff', width=2)
                 except:
                     pass
 
@@ -356,12 +384,11 @@ Note: Global hotkeys require elevated privileges to capture system-wide key even
             if is_pressed:
                 if is_rainbow:
                     hue = (i / NUM_ZONES + frame_count * speed_multiplier * 0.1) % 1.0
-                    rgb_float = colorsys.hsv_to_rgb(hue, 1.0, 1.0)
-                    self.zone_colors[i] = RGBColor(int(rgb_float[0] * 255), int(rgb_float[1] * 255), int(rgb_float[2] * 255))
+                    self.zone_colors[i] = HUE_WHEEL[int(hue * HUE_WHEEL_STEPS) % HUE_WHEEL_STEPS]
                 else:
                     self.zone_colors[i] = base_color
             else:
-                self.zone_colors[i] = RGBColor(0, 0, 0)
+                self.zone_colors[i] = _BLACK
 
     def preview_anti_reactive(self, frame_count: int):
         """Preview anti-reactive effect - all on except when keys are pressed"""
@@ -374,8 +401,7 @@ Note: Global hotkeys require elevated privileges to capture system-wide key even
         for i in range(NUM_ZONES):
             if is_rainbow:
                 hue = (i / NUM_ZONES) % 1.0
-                rgb_float = colorsys.hsv_to_rgb(hue, 1.0, 1.0)
-                self.zone_colors[i] = RGBColor(int(rgb_float[0] * 255), int(rgb_float[1] * 255), int(rgb_float[2] * 255))
+                self.zone_colors[i] = HUE_WHEEL[int(hue * HUE_WHEEL_STEPS) % HUE_WHEEL_STEPS]
             else:
                 self.zone_colors[i] = base_color_rgb
         if hasattr(self, 'key_grid') and self.key_grid:
@@ -388,26 +414,19 @@ Note: Global hotkeys require elevated privileges to capture system-wide key even
         """Simulate key presses that turn OFF keys (anti-reactive)"""
         if not hasattr(self, 'key_grid') or not self.key_grid:
             return
+        itemconfig = self._preview_itemconfig() # Looked up once per frame, not per key
         for row_idx, row in enumerate(self.key_grid):
             for col_idx, key_info in enumerate(row):
                 if is_rainbow:
                     hue = ((row_idx + col_idx) / 10) % 1.0
-                    rgb_float = colorsys.hsv_to_rgb(hue, 1.0, 1.0)
-                    color = RGBColor(int(rgb_float[0] * 255), int(rgb_float[1] * 255), int(rgb_float[2] * 255))
+                    color = HUE_WHEEL[int(hue * HUE_WHEEL_STEPS) % HUE_WHEEL_STEPS]
                 else:
                     color = base_color
                 try:
-                    canvas = self.preview_canvas
-                    canvas.itemconfig(key_info['element'], fill=color.to_hex(), outline='#ffffff', width=1)
+                    itemconfig(key_info['element'], fill=color.to_hex(), outline='#ffffff', width=1)
                 except:
                     pass
-        typing_patterns = [
-            {'keys': [(1, 5), (1, 6), (1, 7), (1, 7), (1, 8)], 'start_frame': 0, 'duration': 15},
-            {'keys': [(2, 1), (1, 1), (2, 2), (2, 0)], 'start_frame': 50, 'duration': 20},
-            {'keys': [(4, 7)], 'start_frame': 100, 'duration': 8},
-            {'keys': [(4, 12), (4, 13), (4, 14), (4, 15)], 'start_frame': 150, 'duration': 12},
-        ]
-        for pattern in typing_patterns:
+        for pattern in _PREVIEW_TYPING_PATTERNS:
             pattern_frame = (frame_count - pattern['start_frame']) % 200
             if 0 <= pattern_frame < pattern['duration']:
                 for i, (row, col) in enumerate(pattern['keys']):
@@ -416,8 +435,7 @@ Note: Global hotkeys require elevated privileges to capture system-wide key even
                         if 0 <= row < len(self.key_grid) and 0 <= col < len(self.key_grid[row]):
                             key_info = self.key_grid[row][col]
                             try:
-                                canvas = self.preview_canvas
-                                canvas.itemconfig(key_info['element'], fill='#000000', outline='#404040', width=1)
+                                itemconfig(key_info['element'], fill='#000000', outline='#404040', width=1)
                             except:
                                 pass
 
@@ -427,7 +445,7 @@ Note: Global hotkeys require elevated privileges to capture system-wide key even
             press_seed = (frame_count * speed_multiplier + i * 23) % 80
             is_pressed = press_seed < 12
             if is_pressed:
-                self.zone_colors[i] = RGBColor(0, 0, 0)
+                self.zone_colors[i] = _BLACK
 
     def preview_rainbow_zones_cycle(self, frame_count: int):
         """FIXED: Rainbow zones with realistic bleeding effect matching hardware"""
@@ -442,6 +460,7 @@ Note: Global hotkeys require elevated privileges to capture system-wide key even
         """Hardware-accurate rainbow effect with key-level bleeding"""
         if not hasattr(self, 'key_grid') or not self.key_grid:
             return
+        itemconfig = self._preview_itemconfig() # Looked up once per frame, not per key
         base_offset = frame_count * speed_multiplier * 0.3
         for row_idx, row in enumerate(self.key_grid):
             for col_idx, key_info in enumerate(row):
@@ -452,11 +471,9 @@ Note: Global hotkeys require elevated privileges to capture system-wide key even
                 if col_idx > 0:
                     right_hue = (base_offset + (15 - (col_idx - 1)) / 15.0 + row_factor * 0.2) % 1.0
                     hue = hue * (1 - bleeding_factor) + right_hue * bleeding_factor
-                rgb_float = colorsys.hsv_to_rgb(hue, 1.0, 1.0)
-                color = RGBColor(int(rgb_float[0] * 255), int(rgb_float[1] * 255), int(rgb_float[2] * 255))
+                color = HUE_WHEEL[int(hue * HUE_WHEEL_STEPS) % HUE_WHEEL_STEPS]
                 try:
-                    canvas = self.preview_canvas
-                    canvas.itemconfig(key_info['element'], fill=color.to_hex())
+                    itemconfig(key_info['element'], fill=color.to_hex())
                 except:
                     pass
 
@@ -468,8 +485,7 @@ Note: Global hotkeys require elevated privileges to capture system-wide key even
         for i in range(extended_zones):
             position = (extended_zones - 1 - i) / extended_zones
             hue = (base_offset + position) % 1.0
-            rgb_float = colorsys.hsv_to_rgb(hue, 1.0, 1.0)
-            extended_colors.append(RGBColor(int(rgb_float[0] * 255), int(rgb_float[1] * 255), int(rgb_float[2] * 255)))
+            extended_colors.append(HUE_WHEEL[int(hue * HUE_WHEEL_STEPS) % HUE_WHEEL_STEPS])
         for i in range(NUM_ZONES):
             start_idx = i * 2
             end_idx = min(start_idx + 3, extended_zones)
@@ -491,7 +507,7 @@ Note: Global hotkeys require elevated privileges to capture system-wide key even
                 self.logger.warning(f"Error updating brightness text display: {e}")
 
     def setup_variables(self):
-        self.zone_colors: List[RGBColor] = [RGBColor(0, 0, 0)] * NUM_ZONES
+        self.zone_colors: List[RGBColor] = list(_BLACK_ZONES)
         self.brightness_var = tk.IntVar(value=self.settings.get("brightness", default_settings["brightness"]))
         self.brightness_text_var = tk.StringVar(value=f"{self.brightness_var.get()}%")
         self.brightness_var.trace_add("write", self._update_brightness_text_display)
@@ -616,6 +632,7 @@ Note: Global hotkeys require elevated privileges to capture system-wide key even
         self.root.bind("<Escape>", self.exit_fullscreen)
         self.root.protocol("WM_DELETE_WINDOW", self.handle_close_button_press)
         self.root.bind("<Unmap>", self.on_minimize_event)
+        self.root.bind("<Map>", self._on_map_event)
 
     def create_common_controls(self, parent: ttk.Frame) -> ttk.Frame:
         controls_frame = ttk.LabelFrame(parent, text="Universal Controls", padding=10)
@@ -929,14 +946,15 @@ Note: Some systems may require additional notification packages"""
             current_y = start_y + row_idx * (key_height + key_gap)
             for col_idx in range(cols_per_row[row_idx]):
                 current_x = start_x + col_idx * (key_width + key_gap)
+                horizontal_zone = min(3, int((col_idx / cols_per_row[row_idx]) * 4))
+                vertical_zone = min(3, int((row_idx / rows) * 4))
+                primary_zone = horizontal_zone
                 key_rect = canvas.create_rectangle(
                     current_x, current_y,
                     current_x + key_width, current_y + key_height,
-                    fill='#404040', outline='#707070', width=1
+                    fill='#404040', outline='#707070', width=1,
+                    tags=('key', _PREVIEW_ZONE_TAGS[primary_zone])
                 )
-                horizontal_zone = min(3, int((col_idx / cols_per_row[row_idx]) * 4))
-                vertical_zone = min(3, int((row_idx / rows) * 4))
-                primary_zone = horizontal_zone
                 key_info = {
                     'element': key_rect,
                     'zone': primary_zone,
@@ -955,7 +973,7 @@ Note: Some systems may require additional notification packages"""
             divider_x = start_x + (zone_idx * keyboard_width / 4)
             divider_line = canvas.create_line(
                 divider_x, start_y, divider_x, start_y + keyboard_height,
-                fill='#555555', width=1, dash=(2, 2)
+                fill='#555555', width=1, dash=(2, 2), tags=('divider',)
             )
             elements.append({'element': divider_line, 'zone': -1, 'type': 'divider'})
         zone_label_y = start_y + keyboard_height + 8
@@ -983,23 +1001,35 @@ Note: Some systems may require additional notification packages"""
         if not canvas or not canvas.winfo_exists() or not elements:
             return
         try:
-            for elem_info in elements:
-                if isinstance(elem_info, dict) and elem_info.get('type') == 'key':
-                    zone = elem_info['zone']
-                    if 0 <= zone < len(self.zone_colors):
-                        color = self.zone_colors[zone].to_hex()
-                        zone_color_obj = self.zone_colors[zone]
-                        if zone_color_obj.r + zone_color_obj.g + zone_color_obj.b > 50:
-                            canvas.itemconfig(elem_info['element'], fill=color, outline='#ffffff', width=2)
-                        else:
-                            canvas.itemconfig(elem_info['element'], fill=color, outline='#606060', width=1)
+            # Keys are tagged by zone: one Tk call per zone instead of one per key
+            itemconfig = canvas.itemconfig
+            zone_colors = self.zone_colors
+            for zone, zone_tag in enumerate(_PREVIEW_ZONE_TAGS):
+                if zone < len(zone_colors):
+                    zone_color_obj = zone_colors[zone]
+                    if zone_color_obj.r + zone_color_obj.g + zone_color_obj.b > 50:
+                        itemconfig(zone_tag, fill=zone_color_obj.to_hex(), outline='#ffffff', width=2)
                     else:
-                        canvas.itemconfig(elem_info['element'], fill='#303030', outline='#505050', width=1)
-                elif isinstance(elem_info, dict) and elem_info.get('type') == 'divider':
-                    canvas.itemconfig(elem_info['element'], fill='#666666')
+                        itemconfig(zone_tag, fill=zone_color_obj.to_hex(), outline='#606060', width=1)
+                else:
+                    itemconfig(zone_tag, fill='#303030', outline='#505050', width=1)
+            itemconfig('divider', fill='#666666')
         except tk.TclError:
             pass
 
+    def _schedule_preview_redraw(self):
+        """Redraw the effect preview once the event loop is idle; repeated requests before then share one redraw."""
+        if not self._preview_redraw_pending:
+            self._preview_redraw_pending = True
+            self.root.after_idle(self._flush_preview_redraw)
+
+    def _flush_preview_redraw(self):
+        self._preview_redraw_pending = False
+        try:
+            self.update_preview_keyboard()
+        except tk.TclError: # Window torn down between scheduling and idle
+            pass
+
     def update_preview_leds(self):
         """Legacy method for compatibility - now redirects to keyboard preview"""
         self.update_preview_keyboard()
@@ -1032,29 +1062,31 @@ Note: Some systems may require additional notification packages"""
                 super().__init__()
                 self.text_widget = text_widget
                 self.master_tk = master_tk
-                self.log_queue = queue.Queue()
+                # The widget only keeps the last max_log_lines lines, so a bounded deque is enough:
+                # a burst between polls just evicts lines that would be trimmed anyway
+                self.max_log_lines = 500
+                self.log_queue: collections.deque = collections.deque(maxlen=self.max_log_lines)
                 self._check_queue_interval_ms = 200
                 self._schedule_queue_check()
             def emit(self, record: logging.LogRecord):
-                self.log_queue.put(self.format(record))
+                self.log_queue.append(self.format(record))
             def _schedule_queue_check(self):
                 if self.master_tk.winfo_exists():
                     self.master_tk.after(self._check_queue_interval_ms, self._process_log_queue)
             def _process_log_queue(self):
                 try:
-                    while not self.log_queue.empty():
-                        message = self.log_queue.get_nowait()
-                        if self.text_widget.winfo_exists():
-                            self.text_widget.config(state=tk.NORMAL)
-                            self.text_widget.insert(tk.END, message + '\n')
-                            self.text_widget.see(tk.END)
-                            num_lines = int(self.text_widget.index('end-1c').split('.')[0])
-                            max_log_lines = 500
-                            if num_lines > max_log_lines:
-                                self.text_widget.delete('1.0', f'{num_lines - max_log_lines + 1}.0')
-                            self.text_widget.config(state=tk.DISABLED)
-                except queue.Empty:
-                    pass
+                    messages = []
+                    while self.log_queue:
+                        messages.append(self.log_queue.popleft())
+                    if messages and self.text_widget.winfo_exists():
+                        # One insert/scroll/trim per poll instead of per message
+                        self.text_widget.config(state=tk.NORMAL)
+                        self.text_widget.insert(tk.END, '\n'.join(messages) + '\n')
+                        self.text_widget.see(tk.END)
+                        num_lines = int(self.text_widget.index('end-1c').split('.')[0])
+                        if num_lines > self.max_log_lines:
+                            self.text_widget.delete('1.0', f'{num_lines - self.max_log_lines + 1}.0')
+                        self.text_widget.config(state=tk.DISABLED)
                 except tk.TclError:
                     pass
                 except (IOError, PermissionError) as e:
@@ -1257,6 +1289,9 @@ The application will continue without tray functionality."""
             self.perform_final_shutdown(clean_shutdown=True)
 
     def on_minimize_event(self, event):
+        if event.widget is self.root:
+            # Nobody can see the preview while the window is unmapped; _on_map_event resumes it
+            self._preview_paused = True
         if self.root.winfo_exists() and self.root.state() == 'iconic':
             self.logger.debug(f"Minimize event detected (state: {self.root.state()}).")
             minimize_to_tray_enabled = self.minimize_to_tray_var.get() if hasattr(self, 'minimize_to_tray_var') else self.settings.get("minimize_to_tray", True)
@@ -1269,6 +1304,14 @@ The application will continue without tray functionality."""
             else:
                 self.logger.info("Window minimized via button/taskbar, using normal taskbar minimize.")
 
+    def _on_map_event(self, event):
+        if event.widget is not self.root or not self._preview_paused:
+            return
+        self._preview_paused = False
+        if self.preview_animation_active and self.preview_animation_id is None:
+            self._preview_next_due = time.monotonic()
+            self._run_preview_animation()
+
     def save_tray_settings(self):
         if hasattr(self, 'minimize_to_tray_var'):
             self.settings.set("minimize_to_tray", self.minimize_to_tray_var.get())
@@ -1331,7 +1374,7 @@ The application will continue without tray functionality."""
                 if self.hardware.is_operational():
                     self.hardware.set_brightness(brightness)
                 self.brightness_var.set(brightness)
-                is_static_type_effect = last_effect_name in ["Static Color", "Static Zone Colors", "Static Rainbow", "Static Gradient"]
+                is_static_type_effect = last_effect_name in _STATIC_EFFECT_NAMES
                 if last_effect_name != "None" and not is_static_type_effect and last_effect_name in self.effect_manager.get_available_effects():
                     self.logger.info(f"Restoring last dynamic effect: {last_effect_name}")
                     self.effect_var.set(last_effect_name)
@@ -1414,14 +1457,14 @@ The application will continue without tray functionality."""
         self.settings.set("effect_rainbow_mode", rainbow_enabled)
         self.update_effect_controls_visibility()
         current_effect_name = self.effect_var.get()
-        is_static_effect = current_effect_name in ["Static Color", "Static Zone Colors", "Static Rainbow", "Static Gradient"]
+        is_static_effect = current_effect_name in _STATIC_EFFECT_NAMES
         if not is_static_effect and current_effect_name != "None":
             self._update_effect_preview_only()
 
     def _update_effect_preview_only(self):
         """Update only the preview without applying to hardware"""
         current_effect_name = self.effect_var.get()
-        if current_effect_name == "None" or current_effect_name in ["Static Color", "Static Zone Colors", "Static Rainbow", "Static Gradient"]:
+        if current_effect_name == "None" or current_effect_name in _STATIC_EFFECT_NAMES:
             return
         self.stop_preview_animation()
         preview_method_name = f"preview_{current_effect_name.lower().replace(' ','_').replace('(','').replace(')','')}"
@@ -1433,24 +1476,22 @@ The application will continue without tray functionality."""
     def _update_generic_preview_on_param_change(self):
         self.stop_preview_animation()
         effect_name = self.effect_var.get()
-        if effect_name == "None" or effect_name in ["Static Color", "Static Zone Colors", "Static Rainbow", "Static Gradient"]:
+        if effect_name == "None" or effect_name in _STATIC_EFFECT_NAMES:
             return
         if not self.effect_rainbow_mode_var.get():
             try:
                 color = RGBColor.from_hex(self.effect_color_var.get())
                 for i in range(NUM_ZONES):
                     self.zone_colors[i] = color
-                self.update_preview_keyboard()
+                self._schedule_preview_redraw()
             except ValueError:
-                for i in range(NUM_ZONES):
-                    self.zone_colors[i] = RGBColor(0,0,0)
-                self.update_preview_keyboard()
+                self.zone_colors[:] = _BLACK_ZONES
+                self._schedule_preview_redraw()
         else:
             for i in range(NUM_ZONES):
                 hue = (i / NUM_ZONES) % 1.0
-                rgb_float = colorsys.hsv_to_rgb(hue, 1.0, 1.0)
-                self.zone_colors[i] = RGBColor(int(rgb_float[0] * 255), int(rgb_float[1] * 255), int(rgb_float[2] * 255))
-            self.update_preview_keyboard()
+                self.zone_colors[i] = HUE_WHEEL[int(hue * HUE_WHEEL_STEPS) % HUE_WHEEL_STEPS]
+            self._schedule_preview_redraw()
 
     def on_effect_change(self, *args):
         if self._loading_settings:
@@ -1467,7 +1508,7 @@ The application will continue without tray functionality."""
         }
         if effect_name in static_effects_map:
             static_effects_map[effect_name]()
-            self.update_preview_keyboard()
+            self._schedule_preview_redraw()
             self.log_status(f"Effect '{effect_name}' selected. Click 'Start Effect' to apply to hardware.")
             return
         if effect_name != "None":
@@ -1480,9 +1521,8 @@ The application will continue without tray functionality."""
                 self._update_generic_preview_on_param_change()
             self.log_status(f"Effect '{effect_name}' selected. Click 'Start Effect' to apply to hardware.")
         else:
-            for i in range(NUM_ZONES):
-                self.zone_colors[i] = RGBColor(0,0,0)
-            self.update_preview_keyboard()
+            self.zone_colors[:] = _BLACK_ZONES
+            self._schedule_preview_redraw()
             self.log_status("No effect selected.")
 
     def preview_static_color(self):
@@ -1493,7 +1533,7 @@ The application will continue without tray functionality."""
             color = RGBColor(0,0,0)
         for i in range(NUM_ZONES):
             self.zone_colors[i] = color
-        self.update_preview_keyboard()
+        self._schedule_preview_redraw()
         if hasattr(self, 'static_preview_canvas'):
             self.update_preview_keyboard(self.static_preview_canvas, 'static_keyboard_elements')
 
@@ -1539,7 +1579,7 @@ The application will continue without tray functionality."""
                 self.log_status(f"Applied static color {hex_color_str} to all zones")
                 for i in range(NUM_ZONES):
                     self.zone_colors[i] = color
-                self.update_preview_keyboard()
+                self._schedule_preview_redraw()
             else:
                 raise HardwareError("HardwareController.set_all_leds_color returned false or failed.")
         except (IOError, PermissionError) as e:
@@ -1560,7 +1600,7 @@ The application will continue without tray functionality."""
                 self.zone_displays[zone_index].config(bg=chosen_hex)
             self.log_status(f"Zone {zone_index+1} GUI color changed. Click 'Apply Zone Colors to HW'.")
             self.settings.set("zone_colors", [zc.to_dict() for zc in self.zone_colors])
-            self.update_preview_keyboard()
+            self._schedule_preview_redraw()
 
     def apply_current_zone_colors_to_hardware(self):
         self._stop_all_visuals_and_clear_hardware()
@@ -1569,7 +1609,7 @@ The application will continue without tray functionality."""
                 self.log_status("Applied current zone colors to hardware.")
                 self.settings.set("zone_colors", [zc.to_dict() for zc in self.zone_colors])
                 self.settings.set("last_mode", "zones")
-                self.update_preview_keyboard()
+                self._schedule_preview_redraw()
             else:
                 raise HardwareError("HardwareController.set_zone_colors returned false.")
         except (IOError, PermissionError) as e:
@@ -1594,7 +1634,7 @@ The application will continue without tray functionality."""
                 self.settings.set("zone_colors", [c.to_dict() for c in self.zone_colors])
                 self.settings.set("last_mode", "rainbow_zones")
                 self.log_status("Applied rainbow pattern to zones.")
-                self.update_preview_keyboard()
+                self._schedule_preview_redraw()
             else:
                 raise HardwareError("Failed to set rainbow colors to hardware (set_zone_colors returned false)")
         except (IOError, PermissionError) as e:
@@ -1608,8 +1648,7 @@ The application will continue without tray functionality."""
             start_color = RGBColor.from_hex(self.gradient_start_color_var.get())
             end_color = RGBColor.from_hex(self.gradient_end_color_var.get())
             gradient_zone_colors_list = []
-            for i in range(NUM_ZONES):
-                ratio = i / float(NUM_ZONES - 1) if NUM_ZONES > 1 else 0.0
+            for ratio in ZONE_GRADIENT_RATIOS:
                 r = int(start_color.r*(1-ratio)+end_color.r*ratio)
                 g = int(start_color.g*(1-ratio)+end_color.g*ratio)
                 b = int(start_color.b*(1-ratio)+end_color.b*ratio)
@@ -1623,7 +1662,7 @@ The application will continue without tray functionality."""
                 self.settings.set("zone_colors", [c.to_dict() for c in self.zone_colors])
                 self.settings.set("last_mode", "gradient_zones")
                 self.log_status("Applied gradient to zones.")
-                self.update_preview_keyboard()
+                self._schedule_preview_redraw()
             else:
                 raise HardwareError("Failed to set gradient colors to hardware (set_zone_colors returned false)")
         except (IOError, PermissionError) as e:
@@ -1634,8 +1673,8 @@ The application will continue without tray functionality."""
     def clear_all_zones_and_effects(self):
         self._stop_all_visuals_and_clear_hardware()
         self.log_status("All effects stopped & LEDs cleared by user action.")
-        black = RGBColor(0,0,0)
-        self.zone_colors = [black] * NUM_ZONES
+        black = _BLACK
+        self.zone_colors[:] = _BLACK_ZONES
         for zd in self.zone_displays:
             if hasattr(zd, 'winfo_exists') and zd.winfo_exists():
                 zd.config(bg=black.to_hex())
@@ -1646,7 +1685,7 @@ The application will continue without tray functionality."""
         self.settings.set("current_color", black.to_dict())
         self.settings.set("zone_colors", [black.to_dict()]*NUM_ZONES)
         self.settings.set("effect_name", "None")
-        self.update_preview_keyboard()
+        self._schedule_preview_redraw()
 
     def open_color_picker(self):
         self.stop_preview_animation()
@@ -1657,7 +1696,7 @@ The application will continue without tray functionality."""
                 self.color_display.config(bg=result[1])
             if self.effect_var.get() == "Static Color":
                 self.preview_static_color()
-                self.update_preview_keyboard()
+                self._schedule_preview_redraw()
 
     def choose_effect_color(self):
         result = colorchooser.askcolor(initialcolor=self.effect_color_var.get(), title="Choose Effect Base Color", parent=self.root)
@@ -1677,7 +1716,7 @@ The application will continue without tray functionality."""
             self.settings.set("gradient_start_color", result[1])
             if self.effect_var.get() == "Static Gradient":
                 self.preview_static_gradient(0)
-                self.update_preview_keyboard()
+                self._schedule_preview_redraw()
 
     def choose_gradient_end(self):
         result = colorchooser.askcolor(initialcolor=self.gradient_end_color_var.get(), title="Choose Gradient End Color", parent=self.root)
@@ -1688,7 +1727,7 @@ The application will continue without tray functionality."""
             self.settings.set("gradient_end_color", result[1])
             if self.effect_var.get() == "Static Gradient":
                 self.preview_static_gradient(0)
-                self.update_preview_keyboard()
+                self._schedule_preview_redraw()
 
     def start_current_effect(self):
         effect_name = self.effect_var.get()
@@ -1703,7 +1742,7 @@ The application will continue without tray functionality."""
             static_effects_map[effect_name]()
             self.settings.set("effect_name", effect_name)
             return
-        if effect_name in ["Reactive", "Anti-Reactive"]:
+        if effect_name in _REACTIVE_EFFECT_NAMES:
             self._stop_all_visuals_and_clear_hardware()
             if not hasattr(self, 'reactive_effects_enabled'):
                 self.setup_reactive_effects_system()
@@ -1768,7 +1807,7 @@ The application will continue without tray functionality."""
 
     def restart_current_effect(self):
         effect_name = self.effect_var.get()
-        if effect_name != "None" and effect_name not in ["Static Color", "Static Zone Colors", "Static Rainbow", "Static Gradient"]:
+        if effect_name != "None" and effect_name not in _STATIC_EFFECT_NAMES:
             self.log_status(f"Restarting effect: {effect_name} due to parameter change.")
             self.root.after(50, self.start_current_effect)
         elif self.preview_animation_active:
@@ -1901,8 +1940,7 @@ The application will use fallback methods (ectool) until EC Direct is implemente
         fpath = filedialog.asksaveasfilename(defaultextension=".json", filetypes=[("JSON Settings File","*.json"), ("All Files","*.*")], title="Export Application Settings", parent=self.root)
         if fpath:
             try:
-                with open(fpath, 'w', encoding='utf-8') as f:
-                    json.dump(self.settings._settings, f, indent=2)
+                Path(fpath).write_bytes(self.settings.to_json_bytes())
                 self.log_status(f"Settings exported to {fpath}")
                 if self.root.winfo_exists():
                     messagebox.showinfo("Export Successful", f"Settings exported to:\n{fpath}", parent=self.root)
@@ -1929,11 +1967,11 @@ The application will use fallback methods (ectool) until EC Direct is implemente
             messagebox.showerror("File Error", f"Invalid or inaccessible file path: {e}", parent=self.root)
             return
         try:
-            with open(fpath, 'r', encoding='utf-8') as f:
-                imported_data = json.load(f)
+            imported_data = self.settings.from_json_bytes(fpath.read_bytes())
             is_valid, error_msg = self._validate_settings_data(imported_data)
             if not is_valid:
                 raise ConfigurationError(f"Invalid settings file: {error_msg}")
+            imported_data.pop("settings_schema_version", None) # File-format tag, not a setting
             self._stop_all_visuals_and_clear_hardware()
             self.settings.update(imported_data)
             self.settings.save_settings()
@@ -1969,6 +2007,11 @@ The application will use fallback methods (ectool) until EC Direct is implemente
             RGBColor.from_hex(data["effect_color"])
         except ValueError:
             return False, f"Invalid hex code for 'effect_color': {data['effect_color']}"
+        if data["zone_colors"] and all(type(v) is int for v in data["zone_colors"]):
+            # Copy of settings.json itself (schema v2): flat r, g, b triples
+            if len(data["zone_colors"]) != NUM_ZONES * 3:
+                return False, f"Expected {NUM_ZONES * 3} zone color components, but found {len(data['zone_colors'])}."
+            return True, "Validation successful."
         if len(data["zone_colors"]) != NUM_ZONES:
              return False, f"Expected {NUM_ZONES} zone colors, but found {len(data['zone_colors'])}."
         for i, zc in enumerate(data["zone_colors"]):
@@ -1993,7 +2036,7 @@ The application will use fallback methods (ectool) until EC Direct is implemente
             zone_colors_list_data = self.settings.get("zone_colors", default_settings['zone_colors'])
             self.zone_colors = [RGBColor.from_dict(d) for d in zone_colors_list_data[:NUM_ZONES]]
             while len(self.zone_colors) < NUM_ZONES:
-                self.zone_colors.append(RGBColor(0,0,0))
+                self.zone_colors.append(_BLACK)
             self.zone_colors = self.zone_colors[:NUM_ZONES]
             if hasattr(self, 'zone_displays'):
                 for i, zd_widget in enumerate(self.zone_displays):
@@ -2024,7 +2067,7 @@ The application will use fallback methods (ectool) until EC Direct is implemente
         finally:
             self._loading_settings = False
         effect_name_on_load = self.effect_var.get()
-        if effect_name_on_load != "None" and effect_name_on_load not in ["Static Color", "Static Zone Colors", "Static Rainbow", "Static Gradient"]:
+        if effect_name_on_load != "None" and effect_name_on_load not in _STATIC_EFFECT_NAMES:
             preview_method_name = f"preview_{effect_name_on_load.lower().replace(' ','_').replace('(','').replace(')','')}"
             if hasattr(self, preview_method_name) and callable(getattr(self, preview_method_name)):
                 self.start_preview_animation(getattr(self, preview_method_name))
@@ -2032,19 +2075,18 @@ The application will use fallback methods (ectool) until EC Direct is implemente
                 self._update_generic_preview_on_param_change()
         elif effect_name_on_load == "Static Color":
             self.preview_static_color()
-            self.update_preview_keyboard()
+            self._schedule_preview_redraw()
         elif effect_name_on_load == "Static Zone Colors":
-            self.update_preview_keyboard()
+            self._schedule_preview_redraw()
         elif effect_name_on_load == "Static Rainbow":
             self.preview_static_rainbow(0)
-            self.update_preview_keyboard()
+            self._schedule_preview_redraw()
         elif effect_name_on_load == "Static Gradient":
             self.preview_static_gradient(0)
-            self.update_preview_keyboard()
+            self._schedule_preview_redraw()
         else:
-            for i in range(NUM_ZONES):
-                self.zone_colors[i] = RGBColor(0,0,0)
-            self.update_preview_keyboard()
+            self.zone_colors[:] = _BLACK_ZONES
+            self._schedule_preview_redraw()
 
     def save_current_gui_state_to_settings(self):
         self.logger.debug("Saving current GUI state to settings...")
@@ -2082,8 +2124,7 @@ The application will use fallback methods (ectool) until EC Direct is implemente
     def preview_color_cycle(self, frame_count: int):
         speed_multiplier = self.get_hardware_synchronized_speed()
         hue = (frame_count * speed_multiplier * 0.5) % 1.0
-        rgb_float = colorsys.hsv_to_rgb(hue, 1.0, 1.0)
-        color = RGBColor(int(rgb_float[0] * 255), int(rgb_float[1] * 255), int(rgb_float[2] * 255))
+        color = HUE_WHEEL[int(hue * HUE_WHEEL_STEPS) % HUE_WHEEL_STEPS]
         for i in range(NUM_ZONES):
             self.zone_colors[i] = color
         self.update_preview_keyboard()
@@ -2139,8 +2180,7 @@ The application will use fallback methods (ectool) until EC Direct is implemente
             if i == active_zone:
                 if is_rainbow:
                     hue = (frame_count * speed_multiplier * 0.3) % 1.0
-                    rgb_float = colorsys.hsv_to_rgb(hue, 1.0, 1.0)
-                    self.zone_colors[i] = RGBColor(int(rgb_float[0] * 255), int(rgb_float[1] * 255), int(rgb_float[2] * 255))
+                    self.zone_colors[i] = HUE_WHEEL[int(hue * HUE_WHEEL_STEPS) % HUE_WHEEL_STEPS]
                 else:
                     self.zone_colors[i] = base_color_rgb
             else:
@@ -2158,7 +2198,7 @@ The application will use fallback methods (ectool) until EC Direct is implemente
                             int(base_color_rgb.b * fade)
                         )
                 else:
-                    self.zone_colors[i] = RGBColor(0, 0, 0)
+                    self.zone_colors[i] = _BLACK
         self.update_preview_keyboard()
 
     def preview_scanner(self, frame_count: int):
@@ -2178,12 +2218,11 @@ The application will use fallback methods (ectool) until EC Direct is implemente
             if i == scanner_pos:
                 if is_rainbow:
                     hue = (scanner_pos / NUM_ZONES) % 1.0
-                    rgb_float = colorsys.hsv_to_rgb(hue, 1.0, 1.0)
-                    self.zone_colors[i] = RGBColor(int(rgb_float[0] * 255), int(rgb_float[1] * 255), int(rgb_float[2] * 255))
+                    self.zone_colors[i] = HUE_WHEEL[int(hue * HUE_WHEEL_STEPS) % HUE_WHEEL_STEPS]
                 else:
                     self.zone_colors[i] = base_color_rgb
             else:
-                self.zone_colors[i] = RGBColor(0, 0, 0)
+                self.zone_colors[i] = _BLACK
         self.update_preview_keyboard()
 
     def preview_strobe(self, frame_count: int):
@@ -2197,12 +2236,11 @@ The application will use fallback methods (ectool) until EC Direct is implemente
             if strobe_on:
                 if is_rainbow:
                     hue = (i / NUM_ZONES) % 1.0
-                    rgb_float = colorsys.hsv_to_rgb(hue, 1.0, 1.0)
-                    self.zone_colors[i] = RGBColor(int(rgb_float[0] * 255), int(rgb_float[1] * 255), int(rgb_float[2] * 255))
+                    self.zone_colors[i] = HUE_WHEEL[int(hue * HUE_WHEEL_STEPS) % HUE_WHEEL_STEPS]
                 else:
                     self.zone_colors[i] = base_color_rgb
             else:
-                self.zone_colors[i] = RGBColor(0, 0, 0)
+                self.zone_colors[i] = _BLACK
         self.update_preview_keyboard()
 
     def preview_ripple(self, frame_count: int):
@@ -2240,12 +2278,11 @@ The application will use fallback methods (ectool) until EC Direct is implemente
             if i == active_zone:
                 if is_rainbow:
                     hue = (frame_count * speed_multiplier * 0.3) % 1.0
-                    rgb_float = colorsys.hsv_to_rgb(hue, 1.0, 1.0)
-                    self.zone_colors[i] = RGBColor(int(rgb_float[0] * 255), int(rgb_float[1] * 255), int(rgb_float[2] * 255))
+                    self.zone_colors[i] = HUE_WHEEL[int(hue * HUE_WHEEL_STEPS) % HUE_WHEEL_STEPS]
                 else:
                     self.zone_colors[i] = base_color_rgb
             else:
-                self.zone_colors[i] = RGBColor(0, 0, 0)
+                self.zone_colors[i] = _BLACK
         self.update_preview_keyboard()
 
     def preview_static_per_zone(self, frame_count):
@@ -2254,8 +2291,7 @@ The application will use fallback methods (ectool) until EC Direct is implemente
     def preview_static_rainbow(self, frame_count):
         for i in range(NUM_ZONES):
             hue = (i / float(NUM_ZONES)) % 1.0 if NUM_ZONES > 0 else 0.0
-            rgb = colorsys.hsv_to_rgb(hue, 1.0, 1.0)
-            self.zone_colors[i] = RGBColor(int(rgb[0] * 255), int(rgb[1] * 255), int(rgb[2] * 255))
+            self.zone_colors[i] = HUE_WHEEL[int(hue * HUE_WHEEL_STEPS) % HUE_WHEEL_STEPS]
 
     def preview_static_gradient(self, frame_count):
         try:
@@ -2263,8 +2299,7 @@ The application will use fallback methods (ectool) until EC Direct is implemente
             ec = RGBColor.from_hex(self.gradient_end_color_var.get())
         except ValueError:
             sc, ec = RGBColor(0,0,0), RGBColor(0,0,0)
-        for i in range(NUM_ZONES):
-            ratio = i / float(NUM_ZONES - 1) if NUM_ZONES > 1 else 0.0
+        for i, ratio in enumerate(ZONE_GRADIENT_RATIOS):
             r = int(sc.r*(1-ratio)+ec.r*ratio)
             g = int(sc.g*(1-ratio)+ec.g*ratio)
             b = int(sc.b*(1-ratio)+ec.b*ratio)
@@ -2306,6 +2341,7 @@ The application will use fallback methods (ectool) until EC Direct is implemente
         is_rainbow = self.effect_rainbow_mode_var.get()
         speed_multiplier = self.get_hardware_synchronized_speed()
         if hasattr(self, 'key_grid') and self.key_grid:
+            itemconfig = self._preview_itemconfig()
             for row_idx, row in enumerate(self.key_grid):
                 for col_idx, key_info in enumerate(row):
                     twinkle_seed = (frame_count * speed_multiplier + row_idx * 7 + col_idx * 13) % 100
@@ -2323,8 +2359,7 @@ The application will use fallback methods (ectool) until EC Direct is implemente
                             int(base_color_rgb.b * intensity)
                         )
                     try:
-                        canvas = self.preview_canvas
-                        canvas.itemconfig(key_info['element'], fill=color.to_hex())
+                        itemconfig(key_info['element'], fill=color.to_hex())
                     except:
                         pass
         else:
@@ -2353,11 +2388,11 @@ The application will use fallback methods (ectool) until EC Direct is implemente
         is_rainbow = self.effect_rainbow_mode_var.get()
         speed_multiplier = self.get_hardware_synchronized_speed()
         if hasattr(self, 'key_grid') and self.key_grid:
+            itemconfig = self._preview_itemconfig()
             for row in self.key_grid:
                 for key_info in row:
                     try:
-                        canvas = self.preview_canvas
-                        canvas.itemconfig(key_info['element'], fill='#404040')
+                        itemconfig(key_info['element'], fill='#404040')
                     except:
                         pass
             num_drops = 3
@@ -2380,16 +2415,14 @@ The application will use fallback methods (ectool) until EC Direct is implemente
                                 int(base_color_rgb.b * intensity)
                             )
                         try:
-                            canvas = self.preview_canvas
-                            canvas.itemconfig(key_info['element'], fill=color.to_hex())
+                            itemconfig(key_info['element'], fill=color.to_hex())
                         except:
                             pass
         else:
             for i in range(NUM_ZONES):
                 if is_rainbow:
                     hue = ((i + frame_count * speed_multiplier * 0.1) / NUM_ZONES) % 1.0
-                    rgb_float = colorsys.hsv_to_rgb(hue, 1.0, 1.0)
-                    self.zone_colors[i] = RGBColor(int(rgb_float[0] * 255), int(rgb_float[1] * 255), int(rgb_float[2] * 255))
+                    self.zone_colors[i] = HUE_WHEEL[int(hue * HUE_WHEEL_STEPS) % HUE_WHEEL_STEPS]
                 else:
                     drop_position = (frame_count * speed_multiplier) % (NUM_ZONES * 2)
                     if drop_position < NUM_ZONES and int(drop_position) == i:
@@ -2408,6 +2441,7 @@ The application will use fallback methods (ectool) until EC Direct is implemente
         self.preview_animation_active = True
         self.preview_function_callable = preview_function
         self._preview_frame_count = 0
+        self._preview_next_due = time.monotonic()
         self._run_preview_animation()
 
     def stop_preview_animation(self):
@@ -2420,6 +2454,9 @@ The application will use fallback methods (ectool) until EC Direct is implemente
         if not self.preview_animation_active or not hasattr(self, 'preview_function_callable') or not callable(self.preview_function_callable):
             self.preview_animation_active = False
             return
+        if self._preview_paused:
+            self.preview_animation_id = None # Re-armed by _on_map_event
+            return
         try:
             self.preview_function_callable(self._preview_frame_count)
             self._preview_frame_count += 1
@@ -2428,8 +2465,14 @@ The application will use fallback methods (ectool) until EC Direct is implemente
             self.stop_preview_animation()
             return
         if self.preview_animation_active:
-            delay_ms = int(ANIMATION_FRAME_DELAY * 1000)
-            self.preview_animation_id = self.root.after(delay_ms, self._run_preview_animation)
+            # Schedule against absolute deadlines so drawing time isn't added to every frame;
+            # after a stall (dragging, a busy mainloop) resync rather than firing a burst
+            self._preview_next_due += ANIMATION_FRAME_DELAY
+            remaining = self._preview_next_due - time.monotonic()
+            if remaining < -ANIMATION_FRAME_DELAY:
+                self._preview_next_due -= remaining
+                remaining = 0.0
+            self.preview_animation_id = self.root.after(max(1, int(remaining * 1000)), self._run_preview_animation)
 
     def toggle_fullscreen(self, event=None):
         self.is_fullscreen = not self.is_fullscreen
@@ -2598,7 +2641,7 @@ The application will use fallback methods (ectool) until EC Direct is implemente
         self.log_to_gui_diag_area("--- Testing ectool ---", "info")
         if hasattr(self.hardware, '_detect_ectool'):
             self.log_to_gui_diag_area("Re-running ectool detection via hardware controller...", "info")
-            self.hardware._detect_ectool()
+            self.hardware._detect_ectool(refresh=True)
         elif hasattr(self.hardware, 'get_ectool_version_or_status'):
             ectool_status = self.hardware.get_ectool_version_or_status()
             self.log_to_gui_diag_area(f"ectool status from hardware controller: {ectool_status}", "info")
@@ -2955,6 +2998,12 @@ Your setup is perfect for independent keyboard vs screen brightness control!"""
                     self.logger.info("LEDs cleared on non-clean/explicit-clear shutdown.")
             except (IOError, PermissionError) as e:
                 self.logger.error(f"Failed to clear LEDs during non-clean shutdown: {e}")
+        # Write any debounced settings change now instead of leaving it to the atexit hook
+        if hasattr(self.settings, 'close'):
+            self.settings.close()
+        # Drain the column writer and end the persistent ectool shell before the process exits
+        if hasattr(self, 'hardware') and hasattr(self.hardware, 'shutdown'):
+            self.hardware.shutdown()
         if self.tray_icon:
             self.logger.info("Stopping tray icon...")
             self.tray_icon.stop()
@@ -2970,6 +3019,9 @@ Your setup is perfect for independent keyboard vs screen brightness control!"""
                 self.root.destroy()
             except tk.TclError as e_destroy:
                 self.logger.error(f"Error destroying Tk root: {e_destroy}")
+        if getattr(self, '_log_listener', None):
+            self._log_listener.stop() # Drains queued records to the log file
+            self._log_listener = None
         sys.exit(0)
 
 
@@ -8,7 +8,7 @@ This file makes 'core' a Python package.
 from .rgb_color import RGBColor
 from .settings import SettingsManager
 from .constants import (
-    NUM_ZONES, LEDS_PER_ZONE, TOTAL_LEDS,
+    NUM_ZONES, LEDS_PER_ZONE, TOTAL_LEDS, ZONE_GRADIENT_RATIOS,
     PREVIEW_WIDTH, PREVIEW_HEIGHT, PREVIEW_LED_SIZE,
     PREVIEW_LED_SPACING, PREVIEW_KEYBOARD_COLOR,
     ANIMATION_FRAME_DELAY, APP_NAME, VERSION,
@@ -28,7 +28,7 @@ from .exceptions import (
 __all__ = [
     "RGBColor",
     "SettingsManager",
-    "NUM_ZONES", "LEDS_PER_ZONE", "TOTAL_LEDS",
+    "NUM_ZONES", "LEDS_PER_ZONE", "TOTAL_LEDS", "ZONE_GRADIENT_RATIOS",
     "PREVIEW_WIDTH", "PREVIEW_HEIGHT", "PREVIEW_LED_SIZE",
     "PREVIEW_LED_SPACING", "PREVIEW_KEYBOARD_COLOR",
     "ANIMATION_FRAME_DELAY", "APP_NAME", "VERSION",
@@ -11,6 +11,8 @@ APP_NAME = "Enhanced Chromebook RGB Control"
 NUM_ZONES = 4  # Number of logical zones the user interacts with
 LEDS_PER_ZONE = 3 # Assumed LEDs per hardware controllable zone segment (e.g., for ectool)
 TOTAL_LEDS = NUM_ZONES * LEDS_PER_ZONE # Total logical LEDs for effects like full keyboard preview
+# Each zone's position across the keyboard, 0.0 (first) to 1.0 (last), for gradients
+ZONE_GRADIENT_RATIOS = tuple(i / (NUM_ZONES - 1) if NUM_ZONES > 1 else 0.0 for i in range(NUM_ZONES))
 
 # Animation Constants
 ANIMATION_FRAME_DELAY = 0.05  # Default 50ms (20 FPS) between animation frames
@@ -2,6 +2,7 @@
 """RGB Color class implementation with validation and conversion utilities."""
 
 import colorsys
+import functools
 import re
 import sys # Added for sys.stderr
 from typing import Dict, Tuple, Any, Union
@@ -9,11 +10,23 @@ from typing import Dict, Tuple, Any, Union
 # Assuming exceptions are in the same 'core' package or accessible
 from .exceptions import ValidationError # This is good, using your custom exception
 
+_HEX_DIGITS_ANY_CASE = '0123456789abcdefABCDEF'
+
+# HSV -> RGB by sextant: which of (v, p, q, t) (colorsys.hsv_to_rgb's names) lands in
+# R, G and B for each sixth of the hue wheel
+_HSV_SEXTANT_PICKS = ((0, 3, 1), (2, 0, 1), (1, 0, 3), (1, 2, 0), (3, 1, 0), (0, 1, 2))
+
+@functools.lru_cache(maxsize=4096)
+def _rgb_to_hex(r: int, g: int, b: int) -> str:
+    # Previews format the same few hundred colours every frame; cache the strings
+    return f"#{r:02x}{g:02x}{b:02x}"
+
 class RGBColor:
     """
     Represents an RGB color with validation and utility methods.
     Ensures R, G, B values are always integers between 0 and 255.
     """
+    __slots__ = ('r', 'g', 'b')
     
     def __init__(self, r: Any, g: Any, b: Any):
         """
@@ -28,6 +41,10 @@ class RGBColor:
     @staticmethod
     def _validate_component(value: Any, component_name: str) -> int:
         """Validates and clamps a single color component. Defaults to 0 on error."""
+        # Plain in-range ints are by far the common case (hex parsing, HSV LUTs, saved
+        # settings) and need neither the float round-trip nor the clamp.
+        if type(value) is int:
+            return value if 0 <= value <= 255 else (0 if value < 0 else 255)
         try:
             # Attempt to convert to float first to handle "128.0", then to int
             val = int(float(value)) 
@@ -53,7 +70,7 @@ class RGBColor:
     
     def to_hex(self) -> str:
         """Convert to hex string format (e.g., '#FF0080')."""
-        return f"#{self.r:02x}{self.g:02x}{self.b:02x}"
+        return _rgb_to_hex(self.r, self.g, self.b)
     
     def to_dict(self) -> Dict[str, int]:
         """Convert to dictionary format."""
@@ -70,11 +87,19 @@ class RGBColor:
             # Consider raising ValidationError or logging instead of print for library use
             # print(f"Warning: from_hex expects a string, got {type(hex_str)}. Defaulting to black.", file=sys.stderr)
             return cls(0, 0, 0) # Default to black
+
+        # Fast path for the canonical '#rrggbb' form stored in settings and presets:
+        # one int parse plus shifts. The strip() check keeps int() from accepting
+        # '+', '_' or whitespace.
+        if len(hex_str) == 7 and hex_str[0] == '#' and not hex_str[1:].strip(_HEX_DIGITS_ANY_CASE):
+            value = int(hex_str[1:], 16)
+            return cls(value >> 16, (value >> 8) & 0xff, value & 0xff)
             
         clean_hex = hex_str.lstrip('#').lower()
         
         if len(clean_hex) == 3: 
-            clean_hex = "".join(c*2 for c in clean_hex)
+            r_c, g_c, b_c = clean_hex
+            clean_hex = f"{r_c}{r_c}{g_c}{g_c}{b_c}{b_c}"
         
         if len(clean_hex) != 6 or not re.fullmatch(r'[0-9a-f]{6}', clean_hex):
             # print(f"Warning: Invalid hex color string '{hex_str}'. Defaulting to black.", file=sys.stderr)
@@ -107,8 +132,16 @@ class RGBColor:
         h_val = max(0.0, min(1.0, h)) # Clamping h,s,v to 0-1 range
         s_val = max(0.0, min(1.0, s))
         v_val = max(0.0, min(1.0, v))
-        r_float, g_float, b_float = colorsys.hsv_to_rgb(h_val, s_val, v_val)
-        return cls(int(r_float * 255), int(g_float * 255), int(b_float * 255))
+        if s_val == 0.0:
+            grey = int(v_val * 255)
+            return cls(grey, grey, grey)
+        # Same arithmetic as colorsys.hsv_to_rgb, with its if/elif chain replaced by a table
+        h6 = h_val * 6.0
+        sextant = int(h6)
+        f = h6 - sextant
+        channels = (v_val, v_val * (1.0 - s_val), v_val * (1.0 - s_val * f), v_val * (1.0 - s_val * (1.0 - f)))
+        r_i, g_i, b_i = _HSV_SEXTANT_PICKS[sextant % 6]
+        return cls(int(channels[r_i] * 255), int(channels[g_i] * 255), int(channels[b_i] * 255))
     
     def to_hsv(self) -> Tuple[float, float, float]:
         """Convert RGB to HSV values (components in range 0-1)."""
@@ -152,8 +185,17 @@ class RGBColor:
         Checks if the current R,G,B values are valid (0-255 integers).
         This should always be true due to the validation in __init__.
         """
-        return (isinstance(self.r, int) and 0 <= self.r <= 255 and
-                isinstance(self.g, int) and 0 <= self.g <= 255 and
-                isinstance(self.b, int) and 0 <= self.b <= 255)
+        r, g, b = self.r, self.g, self.b
+        try:
+            # OR-ing the channels catches any value above 0xff in one comparison;
+            # negatives stay negative through |, so min() covers the lower bound.
+            # Non-int channels (e.g. floats assigned after construction) raise TypeError.
+            return (r | g | b) <= 0xff and min(r, g, b) >= 0
+        except TypeError:
+            return False
 
 
+# Fully saturated hue wheel at 0.001 resolution, built once. Effects step hue in
+# these units and the GUI preview indexes it per key instead of converting HSV.
+HUE_WHEEL_STEPS = 1000
+HUE_WHEEL = tuple(RGBColor.from_hsv(i / HUE_WHEEL_STEPS, 1.0, 1.0) for i in range(HUE_WHEEL_STEPS))
@@ -1,14 +1,19 @@
 #!/usr/bin/env python3
 """Settings management system for RGB Controller"""
 
+import atexit
+import errno
 import json
 import threading
 import logging
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional, Union
+import mmap
 import shutil
+import stat
 import time
 import os
+import weakref
 
 from .rgb_color import RGBColor
 from .constants import SETTINGS_FILE, default_settings, NUM_ZONES
@@ -17,9 +22,81 @@ from .exceptions import ConfigurationError, ValidationError
 from ..utils.decorators import safe_execute
 from ..utils.input_validation import SafeInputValidation
 
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+def _json_default(obj: Any) -> Any:
+    """Serialization hook for values json/orjson cannot encode natively."""
+    if isinstance(obj, RGBColor):
+        return obj.to_dict()
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+# JSON backend shim: orjson (C, bytes in/out) when installed, stdlib json otherwise.
+# orjson.JSONDecodeError subclasses json.JSONDecodeError, so callers catch one type.
+if ORJSON_AVAILABLE:
+    def _json_loads(data: Union[str, bytes]) -> Any:
+        return orjson.loads(data)
+
+    def _json_dumps(obj: Any, pretty: bool = True) -> bytes:
+        return orjson.dumps(obj, default=_json_default, option=orjson.OPT_INDENT_2 if pretty else 0)
+else:
+    def _json_loads(data: Union[str, bytes]) -> Any:
+        return json.loads(data)
+
+    def _json_dumps(obj: Any, pretty: bool = True) -> bytes:
+        return json.dumps(obj, indent=2 if pretty else None, ensure_ascii=False, default=_json_default).encode('utf-8')
+
+def _load_json_file(path: Path, size: int) -> Any:
+    """Parse a JSON file. Above a page, orjson parses straight from an mmap (no read() copy)."""
+    if ORJSON_AVAILABLE and size > mmap.PAGESIZE:
+        with open(path, 'rb') as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            view = memoryview(mm)
+            try:
+                return orjson.loads(view)
+            finally:
+                view.release() # mmap cannot close while a view is exported
+    # stdlib json only takes str/bytes, so small files (and the fallback) just read
+    return _json_loads(path.read_bytes())
+
+# On-disk layout version. v2 stores zone_colors as a flat [r, g, b, r, g, b, ...] int
+# list instead of a list of {"r","g","b"} dicts; loading accepts either layout.
+SETTINGS_SCHEMA_VERSION = 2
+
+def _settings_for_disk(settings: Dict[str, Any]) -> Dict[str, Any]:
+    """Copy of the in-memory settings in the current on-disk layout."""
+    data = settings.copy()
+    zone_colors = data.get("zone_colors")
+    if isinstance(zone_colors, list):
+        data["zone_colors"] = [v for c in zone_colors for v in (c["r"], c["g"], c["b"])]
+    data["settings_schema_version"] = SETTINGS_SCHEMA_VERSION
+    return data
+
+def _unflatten_zone_colors(flat: List[Any]) -> List[Dict[str, Any]]:
+    """[r, g, b, r, g, b, ...] -> [{"r", "g", "b"}, ...]; a trailing partial triple is dropped."""
+    return [{"r": flat[i], "g": flat[i + 1], "b": flat[i + 2]} for i in range(0, len(flat) - 2, 3)]
+
+# Integer settings with fixed bounds (inclusive)
+_INT_SETTING_RANGES = {"brightness": (0, 100), "effect_speed": (1, 10)}
+
+# set()/update() bursts (slider drags, colour picking) are coalesced into one save
+_SAVE_DEBOUNCE_DELAY = 0.25  # seconds
+
+# Managers that may still hold a debounced save. One atexit hook flushes them all; the
+# set is weak so registering for the hook never keeps a discarded manager alive.
+_LIVE_MANAGERS: "weakref.WeakSet[SettingsManager]" = weakref.WeakSet()
+
+def _flush_all_pending_saves() -> None:
+    for manager in list(_LIVE_MANAGERS):
+        manager.flush_pending_save()
+
+atexit.register(_flush_all_pending_saves)
+
 def get_fresh_default_settings() -> Dict[str, Any]:
     """Returns a deep copy of the default settings dictionary."""
-    return json.loads(json.dumps(default_settings))
+    return _json_loads(_json_dumps(default_settings, pretty=False))
 
 
 class SettingsManager:
@@ -36,9 +113,14 @@ class SettingsManager:
         else:
             self.config_file = Path(config_file_path).resolve()
 
-        self._lock = threading.RLock()
+        # Plain Lock: nothing re-enters it. Every write goes through save_settings(), which
+        # takes it per attempt so the retry backoff never sleeps while holding it.
+        self._lock = threading.Lock()
         self._settings: Dict[str, Any] = get_fresh_default_settings()
         self._last_session_clean_shutdown = False # Stored state from previous session
+        self._dirty = False # In-memory changes waiting for the debounced save
+        self._save_timer: Optional[threading.Timer] = None
+        _LIVE_MANAGERS.add(self)
 
         self.load_settings()
 
@@ -46,10 +128,16 @@ class SettingsManager:
     def load_settings(self) -> None:
         with self._lock:
             loaded_successfully = False
-            if self.config_file.exists() and self.config_file.is_file() and self.config_file.stat().st_size > 0:
+            # One stat() answers exists/is-a-file/non-empty together
+            try:
+                file_stat = self.config_file.stat()
+                has_content = stat.S_ISREG(file_stat.st_mode) and file_stat.st_size > 0
+            except OSError:
+                has_content = False
+            if has_content:
                 try:
-                    with open(self.config_file, 'r', encoding='utf-8') as f:
-                        loaded_data = json.load(f)
+                    # Raw bytes straight into the parser; no TextIOWrapper decode layer
+                    loaded_data = _load_json_file(self.config_file, file_stat.st_size)
 
                     if not isinstance(loaded_data, dict):
                         raise ConfigurationError("Settings file root is not a dictionary.")
@@ -80,24 +168,25 @@ class SettingsManager:
             # Always set clean_shutdown to False immediately after loading/recovering
             # This marks the *current* session as potentially unclean until explicitly marked otherwise
             self._settings["clean_shutdown"] = False
-            # Save immediately to persist the False state for the current session start
-            self.save_settings()
+        # Save immediately to persist the False state for the current session start
+        self.save_settings()
 
     def _attempt_settings_recovery_or_default(self):
         backup_file = self.config_file.with_suffix(f"{self.config_file.suffix}.backup")
         ctfn_val = None # Corrupted Temp File Name value
-        if backup_file.exists() and backup_file.is_file():
+        if backup_file.is_file():
             self.logger.warning(f"Attempting to restore settings from standard backup: {backup_file}")
             try:
                 corrupted_file_name = self.config_file.with_suffix(f"{self.config_file.suffix}.corrupted.{int(time.time())}")
-                if self.config_file.exists():
+                try:
                     self.config_file.rename(corrupted_file_name)
                     ctfn_val = corrupted_file_name
+                except FileNotFoundError:
+                    pass
                 
                 shutil.copy2(backup_file, self.config_file)
                 
-                with open(self.config_file, 'r', encoding='utf-8') as f:
-                    restored_data = json.load(f)
+                restored_data = _json_loads(self.config_file.read_bytes())
                 if not isinstance(restored_data, dict):
                     raise ConfigurationError("Restored backup file root is not a dictionary.")
                 
@@ -121,72 +210,166 @@ class SettingsManager:
 
     def _validate_setting_value(self, key: str, loaded_value: Any, default_value_from_schema: Any) -> Any:
         try:
-            if key == "brightness":
-                return SafeInputValidation.validate_integer(loaded_value, 0, 100, default_value_from_schema)
-            elif key == "effect_speed":
-                return SafeInputValidation.validate_integer(loaded_value, 1, 10, default_value_from_schema)
-            elif key == "current_color":
-                if isinstance(loaded_value, dict): return RGBColor.from_dict(loaded_value).to_dict()
-                self.logger.warning(f"Invalid type for '{key}': {type(loaded_value)}, expected dict. Using default.")
-                return default_value_from_schema
-            elif key == "zone_colors":
-                if isinstance(loaded_value, list):
-                    valid_colors = []
-                    default_palette = default_value_from_schema if isinstance(default_value_from_schema, list) and default_value_from_schema else [{"r":0,"g":0,"b":0}]*NUM_ZONES
-                    for i in range(NUM_ZONES):
-                        default_zc_dict = default_palette[i % len(default_palette)]
-                        if i < len(loaded_value) and isinstance(loaded_value[i], dict):
-                            try: valid_colors.append(RGBColor.from_dict(loaded_value[i]).to_dict())
-                            except ValidationError: valid_colors.append(default_zc_dict)
-                        else: valid_colors.append(default_zc_dict)
-                    return valid_colors
-                self.logger.warning(f"Invalid type for '{key}': {type(loaded_value)}, expected list. Using default.")
-                return default_value_from_schema
-            elif key.endswith("_color") and isinstance(default_value_from_schema, str):
-                return SafeInputValidation.validate_color_hex(loaded_value, default_value_from_schema)
-            elif isinstance(default_value_from_schema, bool):
-                return SafeInputValidation.validate_bool(loaded_value, default_value_from_schema)
-            elif isinstance(default_value_from_schema, str):
-                return SafeInputValidation.validate_string(loaded_value, max_length=100, default=default_value_from_schema)
-            
-            # For lists/dicts not specifically handled, ensure type matches
-            if type(loaded_value) == type(default_value_from_schema): return loaded_value
-            else: self.logger.warning(f"Type mismatch for setting '{key}' (loaded: {type(loaded_value)}, expected: {type(default_value_from_schema)}). Using default."); return default_value_from_schema
+            validator = _SETTING_VALIDATORS.get(key)
+            if validator is None: # Keys outside the schema: pick by the default's type
+                validator = _validator_for_default(key, default_value_from_schema)
+            return validator(self, key, loaded_value, default_value_from_schema)
         except Exception as e:
             self.logger.error(f"Unexpected error validating setting '{key}' (value: {loaded_value}): {e}. Using default '{default_value_from_schema}'.", exc_info=True)
             return default_value_from_schema
 
+    def _validate_brightness(self, key: str, loaded_value: Any, default: Any) -> Any:
+        return SafeInputValidation.clamp_int(loaded_value, *_INT_SETTING_RANGES["brightness"], default)
+
+    def _validate_effect_speed(self, key: str, loaded_value: Any, default: Any) -> Any:
+        return SafeInputValidation.clamp_int(loaded_value, *_INT_SETTING_RANGES["effect_speed"], default)
+
+    def _validate_color_dict(self, key: str, loaded_value: Any, default: Any) -> Any:
+        if isinstance(loaded_value, dict): return RGBColor.from_dict(loaded_value).to_dict()
+        self.logger.warning(f"Invalid type for '{key}': {type(loaded_value)}, expected dict. Using default.")
+        return default
+
+    def _validate_zone_colors(self, key: str, loaded_value: Any, default: Any) -> Any:
+        if isinstance(loaded_value, list):
+            if loaded_value and type(loaded_value[0]) is int:
+                loaded_value = _unflatten_zone_colors(loaded_value) # Schema v2 flat layout
+            if len(loaded_value) >= NUM_ZONES:
+                # Common case: a full list of well-formed dicts. One try around the whole
+                # comprehension; any odd element sends us to the per-element path below.
+                try:
+                    return [RGBColor(c['r'], c['g'], c['b']).to_dict() for c in loaded_value[:NUM_ZONES]]
+                except (ValidationError, TypeError, KeyError):
+                    pass
+            valid_colors = []
+            default_palette = default if isinstance(default, list) and default else [{"r":0,"g":0,"b":0}]*NUM_ZONES
+            for i in range(NUM_ZONES):
+                default_zc_dict = default_palette[i % len(default_palette)]
+                if i < len(loaded_value) and isinstance(loaded_value[i], dict):
+                    try: valid_colors.append(RGBColor.from_dict(loaded_value[i]).to_dict())
+                    except ValidationError: valid_colors.append(default_zc_dict)
+                else: valid_colors.append(default_zc_dict)
+            return valid_colors
+        self.logger.warning(f"Invalid type for '{key}': {type(loaded_value)}, expected list. Using default.")
+        return default
+
+    def _validate_hex_color(self, key: str, loaded_value: Any, default: Any) -> Any:
+        return SafeInputValidation.validate_color_hex(loaded_value, default)
+
+    def _validate_bool_setting(self, key: str, loaded_value: Any, default: Any) -> Any:
+        return SafeInputValidation.validate_bool(loaded_value, default)
+
+    def _validate_string_setting(self, key: str, loaded_value: Any, default: Any) -> Any:
+        return SafeInputValidation.validate_string(loaded_value, max_length=100, default=default)
+
+    def _validate_same_type(self, key: str, loaded_value: Any, default: Any) -> Any:
+        # For lists/dicts not specifically handled, ensure type matches
+        if type(loaded_value) == type(default): return loaded_value
+        self.logger.warning(f"Type mismatch for setting '{key}' (loaded: {type(loaded_value)}, expected: {type(default)}). Using default.")
+        return default
+
+    def _schedule_save(self) -> None:
+        # Caller holds self._lock. Restart the timer so a burst of changes saves once.
+        self._dirty = True
+        if self._save_timer is not None:
+            self._save_timer.cancel()
+        self._save_timer = threading.Timer(_SAVE_DEBOUNCE_DELAY, self.flush_pending_save)
+        self._save_timer.daemon = True
+        self._save_timer.start()
+
+    def flush_pending_save(self) -> None:
+        """Write any changes still waiting on the debounce timer."""
+        with self._lock:
+            if not self._dirty:
+                return
+        self.save_settings()
+
+    def close(self) -> None:
+        """Cancel the debounce timer and write whatever it was holding back."""
+        with self._lock:
+            timer, self._save_timer = self._save_timer, None
+        if timer is not None:
+            timer.cancel()
+        # A timer that already fired either still has us dirty (we save) or has saved under the lock
+        self.flush_pending_save()
+        _LIVE_MANAGERS.discard(self)
+
     @safe_execute(severity="high", max_attempts=2)
     def save_settings(self) -> None:
+        # The lock is held for one attempt only; safe_execute's backoff runs outside it
         with self._lock:
+            self._save_locked()
+
+    def _save_locked(self) -> None:
+        # Caller holds self._lock. Raises ConfigurationError; retrying is save_settings' job.
+        if self._save_timer is not None:
+            self._save_timer.cancel() # This save covers whatever the timer was waiting for
+            self._save_timer = None
+        temp_file_path = self.config_file.with_suffix(f'.tmp.{os.getpid()}')
+        try:
+            self.config_file.parent.mkdir(parents=True, exist_ok=True)
+            data_to_save = _settings_for_disk(self._settings)
+            payload = _json_dumps(data_to_save)
+
+            # The file is a few KB; if it already holds exactly these bytes there is nothing to write
+            try: existing = self.config_file.read_bytes()
+            except FileNotFoundError: existing = None
+            if existing == payload:
+                self._dirty = False
+                self.logger.debug("Settings unchanged on disk; skipping write to %s", self.config_file)
+                return
+            
+            # Create a simple, non-timestamped backup file before writing a new one.
+            # This file will be overwritten on each successful save, keeping the *last good* version.
+            backup_file = self.config_file.with_suffix(f"{self.config_file.suffix}.backup")
+            # Bytes only: the backup never needs the original's timestamps/permissions.
+            # Copy straight away rather than exists()-then-copy; a missing file just means first save.
+            try: shutil.copyfile(self.config_file, backup_file); self.logger.debug("Created backup: %s", backup_file)
+            except FileNotFoundError: pass
+            except Exception as e_backup: self.logger.warning(f"Could not create backup before saving: {e_backup}")
+            
+            # Raw fd write of the encoded bytes: no Python file object or buffering layer
+            fd = os.open(temp_file_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
             try:
-                self.config_file.parent.mkdir(parents=True, exist_ok=True)
-                data_to_save = self._settings.copy()
-                
-                # Create a simple, non-timestamped backup file before writing a new one.
-                # This file will be overwritten on each successful save, keeping the *last good* version.
-                backup_file = self.config_file.with_suffix(f"{self.config_file.suffix}.backup")
-                if self.config_file.exists():
-                    try: shutil.copy2(self.config_file, backup_file); self.logger.debug(f"Created backup: {backup_file}")
-                    except Exception as e_backup: self.logger.warning(f"Could not create backup before saving: {e_backup}")
-                
-                temp_file_path = self.config_file.with_suffix(f'.tmp.{os.getpid()}')
-                with open(temp_file_path, 'w', encoding='utf-8') as f:
-                    json.dump(data_to_save, f, indent=2, ensure_ascii=False)
-                    f.flush(); os.fsync(f.fileno())
-                
-                os.replace(temp_file_path, self.config_file)
-                self.logger.info(f"Settings successfully saved to {self.config_file}")
+                view = memoryview(payload)
+                while view:
+                    view = view[os.write(fd, view):]
+                os.fsync(fd)
+            finally:
+                os.close(fd)
+            
+            os.replace(temp_file_path, self.config_file)
+            self._dirty = False
+            self.logger.info(f"Settings successfully saved to {self.config_file}")
+
+        except Exception as e:
+            # Don't leave a half-written temp file behind; one unlink, no exists() probe
+            try: temp_file_path.unlink(missing_ok=True)
+            except Exception: pass
+            if isinstance(e, OSError) and e.errno == errno.ENOSPC:
+                # Free space is only worth a statvfs once a write has actually run out of it
+                try: self.logger.error(f"No space left to save settings: {shutil.disk_usage(self.config_file.parent).free} bytes free on {self.config_file.parent}.")
+                except OSError: pass
+            self.logger.error(f"Critical error saving settings to {self.config_file}: {e}", exc_info=True)
+            raise ConfigurationError(f"Failed to save settings to {self.config_file}: {e}") from e
 
-            except Exception as e:
-                self.logger.error(f"Critical error saving settings to {self.config_file}: {e}", exc_info=True)
-                raise ConfigurationError(f"Failed to save settings to {self.config_file}: {e}") from e
+    def to_json_bytes(self) -> bytes:
+        """Current settings as indented UTF-8 JSON; uses orjson when it is installed."""
+        with self._lock:
+            return _json_dumps(self._settings)
+
+    @staticmethod
+    def from_json_bytes(data: bytes) -> Any:
+        """Parse JSON produced by to_json_bytes (or any settings export). Raises json.JSONDecodeError."""
+        return _json_loads(data)
 
     def get(self, key: str, default_override: Optional[Any] = None) -> Any:
         with self._lock:
-            default_from_schema = get_fresh_default_settings().get(key)
-            effective_default = default_override if default_override is not None else default_from_schema
-            return self._settings.get(key, effective_default)
+            if key in self._settings:
+                return self._settings[key]
+            if default_override is not None:
+                return default_override
+            # Only build a fresh copy of the defaults when the key is actually missing
+            return get_fresh_default_settings().get(key)
 
     def set(self, key: str, value: Any) -> None:
         with self._lock:
@@ -197,26 +380,30 @@ class SettingsManager:
             validated_value = self._validate_setting_value(key, value, default_val_for_validation)
             if self._settings.get(key) != validated_value or key not in self._settings:
                 self._settings[key] = validated_value
-                # Settings are saved whenever a single setting changes.
-                # This ensures settings are up-to-date even if app crashes shortly after a change.
-                self.save_settings()
-                self.logger.debug(f"Setting '{key}' updated to: {validated_value}")
+                # Saved shortly after the last change in a burst (and at exit), so a crash
+                # loses at most the final debounce window instead of paying a write per change.
+                self._schedule_save()
+                self.logger.debug("Setting '%s' updated to: %s", key, validated_value)
 
     def update(self, new_settings_dict: Dict[str, Any]) -> None:
         with self._lock:
             changed = False
+            current = self._settings
             for key, value in new_settings_dict.items():
                 if key not in default_settings:
                     self.logger.warning(f"Update: Ignoring unknown setting key: '{key}'.")
                     continue
+                # Stored values are already validated, so an equal raw value cannot change anything
+                if key in current and current[key] == value:
+                    continue
                 default_val_for_validation = default_settings.get(key)
                 validated_value = self._validate_setting_value(key, value, default_val_for_validation)
                 if self._settings.get(key) != validated_value or key not in self._settings:
                     self._settings[key] = validated_value
                     changed = True
-                    self.logger.debug(f"Update: Setting '{key}' to: {validated_value}")
+                    self.logger.debug("Update: Setting '%s' to: %s", key, validated_value)
             if changed:
-                self.save_settings()
+                self._schedule_save()
                 self.logger.info(f"Settings updated. {sum(1 for k in new_settings_dict if k in default_settings)} provided keys processed.")
             else:
                 self.logger.debug("Update called, but no actual setting values changed after validation.")
@@ -227,7 +414,7 @@ class SettingsManager:
         # Directly update _settings and save to ensure this specific flag is persisted.
         with self._lock:
             self._settings["clean_shutdown"] = True
-            self.save_settings()
+        self.save_settings()
 
     def was_previous_session_clean(self) -> bool:
         """Returns True if the previous session exited cleanly, False otherwise."""
@@ -239,4 +426,26 @@ class SettingsManager:
             self._settings = get_fresh_default_settings()
             self._last_session_clean_shutdown = False # After reset, next startup is like first run or unclean
             self._settings["clean_shutdown"] = False # Mark current state as potentially unclean
-            self.save_settings()
+        self.save_settings()
+
+
+def _validator_for_default(key: str, default: Any) -> Callable[..., Any]:
+    """Generic validator for a key, chosen from the type of its schema default."""
+    if key.endswith("_color") and isinstance(default, str):
+        return SettingsManager._validate_hex_color
+    if isinstance(default, bool):
+        return SettingsManager._validate_bool_setting
+    if isinstance(default, str):
+        return SettingsManager._validate_string_setting
+    return SettingsManager._validate_same_type
+
+# key -> validator, resolved once from the schema instead of walking an if/elif chain per value
+_SETTING_VALIDATORS: Dict[str, Callable[..., Any]] = {
+    key: _validator_for_default(key, default) for key, default in default_settings.items()
+}
+_SETTING_VALIDATORS.update({
+    "brightness": SettingsManager._validate_brightness,
+    "effect_speed": SettingsManager._validate_effect_speed,
+    "current_color": SettingsManager._validate_color_dict,
+    "zone_colors": SettingsManager._validate_zone_colors,
+})
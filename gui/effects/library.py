@@ -10,11 +10,83 @@ import logging
 from typing import List, Dict, Any, Optional, Callable
 from dataclasses import dataclass, field
 
-from ..core.rgb_color import RGBColor
+from ..core.rgb_color import RGBColor, HUE_WHEEL, HUE_WHEEL_STEPS
 from ..core.constants import NUM_ZONES, LEDS_PER_ZONE, MIN_ANIMATION_FRAME_DELAY, BASE_ANIMATION_DELAY_SPEED_1, TOTAL_LEDS, REACTIVE_DELAY
 from ..hardware.controller import HardwareController 
 from ..utils.decorators import safe_execute 
 
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+# Fully saturated hue wheel at 0.001 resolution, the step size effects advance
+# hue by, so a table lookup gives the same colours as from_hsv per frame.
+_HUE_STEPS = HUE_WHEEL_STEPS
+_HUE_LUT = HUE_WHEEL
+
+def _pack_rgb(color: RGBColor) -> int:
+    return (color.r << 16) | (color.g << 8) | color.b
+
+# Hue spacing between neighbouring zones (1 / NUM_ZONES of the wheel) in table steps
+_ZONE_HUE_STEP = _HUE_STEPS // NUM_ZONES
+
+# Same wheel as 0xRRGGBB ints for HardwareController.set_all_leds_color_packed
+_HUE_PACKED = tuple(_pack_rgb(c) for c in _HUE_LUT)
+
+# One breathing cycle, (sin + 1) / 2 sampled at _BREATH_STEPS points. Effects keep a
+# float phase in table units and index with int(phase) & mask.
+_BREATH_STEPS = 256
+_BREATH_MASK = _BREATH_STEPS - 1
+_BREATH_TABLE = tuple((math.sin(2 * math.pi * i / _BREATH_STEPS) + 1) / 2 for i in range(_BREATH_STEPS))
+
+if NUMPY_AVAILABLE:
+    _BREATH_ARRAY = np.array(_BREATH_TABLE, dtype=np.float64)
+
+def _breathing_frames(color: RGBColor) -> tuple:
+    """Packed 0xRRGGBB of color dimmed by every _BREATH_TABLE level (same truncation as with_brightness)."""
+    if NUMPY_AVAILABLE:
+        rgb = np.array((color.r, color.g, color.b), dtype=np.float64)
+        levels = (_BREATH_ARRAY[:, None] * rgb).astype(np.uint32) # (_BREATH_STEPS, 3), truncated
+        packed = (levels[:, 0] << 16) | (levels[:, 1] << 8) | levels[:, 2]
+        return tuple(packed.tolist())
+    return tuple(_pack_rgb(color.with_brightness(v)) for v in _BREATH_TABLE)
+
+# wave: per-zone intensity for each wave-centre position, in tenths of a zone over the
+# NUM_ZONES + 2 span the wave travels; (1 - dist/2)^2 within two zones of the centre
+_WAVE_LEVELS = tuple(
+    tuple((1 - abs(i - pos / 10) / 2.0) ** 2 if abs(i - pos / 10) < 2.0 else 0.0 for i in range(NUM_ZONES))
+    for pos in range((NUM_ZONES + 2) * 10)
+)
+
+# Shared dark colour / frame for blanking zones. Treated as immutable: effects put these
+# into their reused frame lists but never modify an RGBColor in place.
+_BLACK = RGBColor(0, 0, 0)
+_BLACK_FRAME = (_BLACK,) * NUM_ZONES
+
+class _FrameClock:
+    """
+    Paces an effect loop on absolute deadlines: each wait() sleeps until the next
+    multiple of delay, so time spent building/sending a frame is not added on top.
+    """
+    __slots__ = ('stop_event', 'delay', 'next_frame')
+
+    def __init__(self, stop_event: threading.Event, delay: float):
+        self.stop_event = stop_event
+        self.delay = delay
+        self.next_frame = time.monotonic()
+
+    def wait(self) -> bool:
+        """Sleep until the next frame is due; True if the effect was stopped meanwhile."""
+        self.next_frame += self.delay
+        remaining = self.next_frame - time.monotonic()
+        if remaining < -self.delay:
+            # More than a frame behind (stall, suspend): resync instead of bursting frames
+            self.next_frame -= remaining
+            remaining = 0.0
+        return self.stop_event.wait(remaining if remaining > 0 else 0)
+
 @dataclass
 class EffectState:
     """Maintains state for effects that need persistence between frames."""
@@ -41,76 +113,99 @@ class EffectLibrary:
     @staticmethod
     @safe_execute()
     def breathing(stop_event: threading.Event, hardware: HardwareController, speed: int, color: RGBColor, rainbow_mode: bool = False, **kwargs):
-        state = EffectState()
         delay = EffectLibrary._get_delay(speed)
+        clock = _FrameClock(stop_event, delay)
+        # sin(frame * 0.1 * speed) advances 0.1 * speed radians per frame
+        phase_step = 0.1 * speed * _BREATH_STEPS / (2 * math.pi)
+        phase = 0.0
+        breath_table = _BREATH_TABLE
+        # A fixed colour only ever takes _BREATH_STEPS shades: build them once, packed
+        frames = None if rainbow_mode else _breathing_frames(color)
+        hue_lut = _HUE_LUT
+        hue_idx = 0 # Rainbow hue in 1/_HUE_STEPS units, advancing 0.005 per frame
         while not stop_event.is_set():
-            brightness = (math.sin(state.frame_count * 0.1 * speed) + 1) / 2
-            base_color = RGBColor.from_hsv(state.hue_offset, 1, 1) if rainbow_mode else color
-            final_color = base_color.with_brightness(brightness)
-            if not hardware.set_all_leds_color(final_color): break
-            if rainbow_mode: state.hue_offset = (state.hue_offset + 0.005) % 1.0
-            state.frame_count += 1
-            if stop_event.wait(delay): break
+            idx = int(phase) & _BREATH_MASK
+            if frames is not None:
+                packed = frames[idx]
+            else:
+                # Dim the table hue straight into a packed int (truncating, like with_brightness);
+                # no RGBColor built or validated per frame
+                base, level = hue_lut[hue_idx], breath_table[idx]
+                packed = (int(base.r * level) << 16) | (int(base.g * level) << 8) | int(base.b * level)
+                hue_idx = (hue_idx + 5) % _HUE_STEPS
+            if not hardware.set_all_leds_color_packed(packed): break
+            phase = (phase + phase_step) % _BREATH_STEPS
+            if clock.wait(): break
     
     @staticmethod
     @safe_execute()
     def color_cycle(stop_event: threading.Event, hardware: HardwareController, speed: int, **kwargs):
-        state = EffectState()
         delay = EffectLibrary._get_delay(speed)
+        clock = _FrameClock(stop_event, delay)
+        hue_packed = _HUE_PACKED
+        hue_idx = 0 # Hue in 1/_HUE_STEPS units; advancing by speed == 0.001 * speed per frame
+        hue_step = int(speed)
         while not stop_event.is_set():
-            color = RGBColor.from_hsv(state.hue_offset, 1.0, 1.0)
-            if not hardware.set_all_leds_color(color): break
-            state.hue_offset = (state.hue_offset + 0.001 * speed) % 1.0
-            if stop_event.wait(delay): break
+            if not hardware.set_all_leds_color_packed(hue_packed[hue_idx]): break
+            hue_idx = (hue_idx + hue_step) % _HUE_STEPS
+            if clock.wait(): break
 
     @staticmethod
     @safe_execute()
     def wave(stop_event: threading.Event, hardware: HardwareController, speed: int, color: RGBColor, rainbow_mode: bool = False, **kwargs):
-        state = EffectState()
         delay = EffectLibrary._get_delay(speed)
+        clock = _FrameClock(stop_event, delay)
+        hue_lut = _HUE_LUT
+        hue_idx = 0 # Rainbow hue in 1/_HUE_STEPS units; zone i sits 0.1 (100 steps) further on
+        wave_levels = _WAVE_LEVELS
+        position = 0 # Wave centre in tenths of a zone; advances 0.1 * speed per frame
+        position_step = int(speed)
+        frame = bytearray(NUM_ZONES * 3) # R, G, B per zone, rewritten in place every frame
         while not stop_event.is_set():
-            colors = [RGBColor(0,0,0)] * NUM_ZONES
-            for i in range(NUM_ZONES):
-                dist = abs(i - state.position)
-                if dist < 2.0:
-                    intensity = (1 - (dist / 2.0)) ** 2
-                    base_color = RGBColor.from_hsv((state.hue_offset + i*0.1)%1.0,1,1) if rainbow_mode else color
-                    colors[i] = base_color.with_brightness(intensity)
-            if not hardware.set_zone_colors(colors): break
-            if rainbow_mode: state.hue_offset = (state.hue_offset + 0.005) % 1.0
-            state.position = (state.position + 0.1 * speed) % (NUM_ZONES + 2)
-            if stop_event.wait(delay): break
+            for i, intensity in enumerate(wave_levels[position]):
+                base = hue_lut[(hue_idx + i * 100) % _HUE_STEPS] if rainbow_mode else color
+                # Same truncation as with_brightness; zero intensity blanks the zone
+                frame[i * 3:i * 3 + 3] = (int(base.r * intensity), int(base.g * intensity), int(base.b * intensity))
+            if not hardware.set_zone_colors_buffer(frame): break
+            if rainbow_mode: hue_idx = (hue_idx + 5) % _HUE_STEPS
+            position = (position + position_step) % len(wave_levels)
+            if clock.wait(): break
 
     @staticmethod
     @safe_execute()
     def zone_chase(stop_event: threading.Event, hardware: HardwareController, speed: int, color: RGBColor, rainbow_mode: bool = False, **kwargs):
-        state = EffectState()
         delay = EffectLibrary._get_delay(speed * 2)
+        clock = _FrameClock(stop_event, delay)
+        hue_lut = _HUE_LUT
+        hue_idx = 0 # Hue in 1/_HUE_STEPS units, advancing 0.005 per frame
+        position = 0 # Lit zone in tenths of a zone, advancing 0.1 * speed per frame
+        position_step, position_span = int(speed), NUM_ZONES * 10
+        colors = list(_BLACK_FRAME) # Reused every frame; set_zone_colors reads it before returning
         while not stop_event.is_set():
-            colors = [RGBColor(0,0,0)] * NUM_ZONES
-            active_zone = int(state.position)
-            base_color = RGBColor.from_hsv((state.hue_offset + active_zone/NUM_ZONES)%1.0, 1, 1) if rainbow_mode else color
-            colors[active_zone] = base_color
+            colors[:] = _BLACK_FRAME
+            active_zone = position // 10
+            colors[active_zone] = hue_lut[(hue_idx + active_zone * _ZONE_HUE_STEP) % _HUE_STEPS] if rainbow_mode else color
             if not hardware.set_zone_colors(colors): break
-            state.position = (state.position + 0.1 * speed) % NUM_ZONES
-            if rainbow_mode: state.hue_offset = (state.hue_offset + 0.005) % 1.0
-            state.frame_count += 1
-            if stop_event.wait(delay): break
+            position = (position + position_step) % position_span
+            if rainbow_mode: hue_idx = (hue_idx + 5) % _HUE_STEPS
+            if clock.wait(): break
 
     @staticmethod
     @safe_execute()
     def starlight(stop_event: threading.Event, hardware: HardwareController, speed: int, color: RGBColor, rainbow_mode: bool = False, **kwargs):
         delay = EffectLibrary._get_delay(speed * 2)
+        clock = _FrameClock(stop_event, delay)
+        colors = list(_BLACK_FRAME) # Reused every frame; set_zone_colors reads it before returning
         while not stop_event.is_set():
-            colors = [RGBColor(0,0,0)] * NUM_ZONES
+            colors[:] = _BLACK_FRAME
             num_stars = random.randint(1, (NUM_ZONES // 2) + 1)
             for _ in range(num_stars):
                 zone = random.randint(0, NUM_ZONES-1)
                 brightness = random.uniform(0.2, 1.0)
-                base_color = RGBColor.from_hsv(random.random(), 1, 1) if rainbow_mode else color
+                base_color = _HUE_LUT[random.randrange(_HUE_STEPS)] if rainbow_mode else color
                 colors[zone] = base_color.with_brightness(brightness)
             if not hardware.set_zone_colors(colors): break
-            if stop_event.wait(delay): break
+            if clock.wait(): break
 
     # --- ALIASED & SIMULATED EFFECTS ---
 
@@ -118,37 +213,48 @@ class EffectLibrary:
     @safe_execute()
     def reactive(stop_event: threading.Event, hardware: HardwareController, speed: int, color: RGBColor, rainbow_mode: bool = False, **kwargs):
         """Keys are off by default and light up when 'pressed' (simulated)."""
-        state = EffectState()
         delay = EffectLibrary._get_delay(speed * 2)
+        clock = _FrameClock(stop_event, delay)
+        hue_lut = _HUE_LUT
+        hue_idx = 0 # Hue in 1/_HUE_STEPS units, advancing 0.01 per frame
+        position = 0 # Tenths of a zone over NUM_ZONES plus a 4-zone pause, advancing 0.2 * speed
+        position_step, position_span = 2 * int(speed), (NUM_ZONES + 4) * 10
+        colors = list(_BLACK_FRAME) # Reused every frame; set_zone_colors reads it before returning
         while not stop_event.is_set():
-            colors = [RGBColor(0,0,0)] * NUM_ZONES
-            active_zone = int(state.position) % (NUM_ZONES + 4) # Add a pause
+            colors[:] = _BLACK_FRAME
+            active_zone = position // 10
             if active_zone < NUM_ZONES:
-                base_color = RGBColor.from_hsv((state.hue_offset + active_zone/NUM_ZONES)%1.0,1,1) if rainbow_mode else color
-                colors[active_zone] = base_color
+                colors[active_zone] = hue_lut[(hue_idx + active_zone * _ZONE_HUE_STEP) % _HUE_STEPS] if rainbow_mode else color
             if not hardware.set_zone_colors(colors): break
-            state.position = (state.position + 0.2 * speed)
-            if rainbow_mode: state.hue_offset = (state.hue_offset + 0.01) % 1.0
-            if stop_event.wait(delay): break
+            position = (position + position_step) % position_span
+            if rainbow_mode: hue_idx = (hue_idx + 10) % _HUE_STEPS
+            if clock.wait(): break
 
     @staticmethod
     @safe_execute()
     def anti_reactive(stop_event: threading.Event, hardware: HardwareController, speed: int, color: RGBColor, rainbow_mode: bool = False, **kwargs):
         """Keys are on by default and turn off when 'pressed' (simulated)."""
-        state = EffectState()
         delay = EffectLibrary._get_delay(speed * 2)
+        clock = _FrameClock(stop_event, delay)
+        hue_lut = _HUE_LUT
+        hue_idx = 0 # Hue in 1/_HUE_STEPS units, advancing 0.01 per frame
+        position = 0 # Tenths of a zone over NUM_ZONES plus a 4-zone pause, advancing 0.2 * speed
+        position_step, position_span = 2 * int(speed), (NUM_ZONES + 4) * 10
+        colors = [color] * NUM_ZONES # Reused every frame; set_zone_colors reads it before returning
+        solid_frame = (color,) * NUM_ZONES
         while not stop_event.is_set():
             if rainbow_mode:
-                colors = [RGBColor.from_hsv((state.hue_offset + i/NUM_ZONES)%1.0, 1, 1) for i in range(NUM_ZONES)]
+                for i in range(NUM_ZONES):
+                    colors[i] = hue_lut[(hue_idx + i * _ZONE_HUE_STEP) % _HUE_STEPS]
             else:
-                colors = [color] * NUM_ZONES
-            active_zone = int(state.position) % (NUM_ZONES + 4) # Add a pause
+                colors[:] = solid_frame
+            active_zone = position // 10
             if active_zone < NUM_ZONES:
-                colors[active_zone] = RGBColor(0,0,0)
+                colors[active_zone] = _BLACK
             if not hardware.set_zone_colors(colors): break
-            state.position = (state.position + 0.2 * speed)
-            if rainbow_mode: state.hue_offset = (state.hue_offset + 0.01) % 1.0
-            if stop_event.wait(delay): break
+            position = (position + position_step) % position_span
+            if rainbow_mode: hue_idx = (hue_idx + 10) % _HUE_STEPS
+            if clock.wait(): break
 
     # --- Corrected Aliases ---
     
@@ -170,9 +276,22 @@ class EffectLibrary:
         
     @staticmethod
     @safe_execute()
-    def strobe(stop_event: threading.Event, hardware: HardwareController, **kwargs):
-        kwargs['speed'] = min(10, kwargs.get('speed', 5) + 3) # Strobe is a faster pulse
-        EffectLibrary.breathing(stop_event, hardware, **kwargs)
+    def strobe(stop_event: threading.Event, hardware: HardwareController, speed: int = 5, color: Optional[RGBColor] = None, rainbow_mode: bool = False, **kwargs):
+        """Hard on/off flashing; each on and each off phase lasts one period."""
+        # Both frames and the period are fixed for the whole effect: work them out once
+        clock = _FrameClock(stop_event, max(MIN_ANIMATION_FRAME_DELAY, 0.05 + (10 - speed) * 0.05))
+        on_frame = _pack_rgb(color) if color is not None else 0xFFFFFF
+        off_frame = 0x000000
+        hue_packed = _HUE_PACKED
+        hue_idx = 0
+        lit = False
+        while not stop_event.is_set():
+            lit = not lit
+            if lit and rainbow_mode:
+                on_frame = hue_packed[hue_idx]
+                hue_idx = (hue_idx + 50) % _HUE_STEPS # Next flash 0.05 further round the wheel
+            if not hardware.set_all_leds_color_packed(on_frame if lit else off_frame): break
+            if clock.wait(): break
 
     @staticmethod
     @safe_execute()
@@ -195,13 +314,18 @@ class EffectLibrary:
     @staticmethod
     @safe_execute()
     def rainbow_zones_cycle(stop_event: threading.Event, hardware: HardwareController, speed: int, **kwargs):
-        state = EffectState()
         delay = EffectLibrary._get_delay(speed)
+        clock = _FrameClock(stop_event, delay)
+        hue_lut = _HUE_LUT
+        hue_idx = 0 # Hue in 1/_HUE_STEPS units, advancing 0.002 * speed per frame
+        hue_step = 2 * int(speed)
+        colors = list(_BLACK_FRAME) # Reused every frame; set_zone_colors reads it before returning
         while not stop_event.is_set():
-            colors = [RGBColor.from_hsv((state.hue_offset + i/NUM_ZONES) % 1.0, 1, 1) for i in range(NUM_ZONES)]
+            for i in range(NUM_ZONES):
+                colors[i] = hue_lut[(hue_idx + i * _ZONE_HUE_STEP) % _HUE_STEPS]
             if not hardware.set_zone_colors(colors): break
-            state.hue_offset = (state.hue_offset + 0.002 * speed) % 1.0
-            if stop_event.wait(delay): break
+            hue_idx = (hue_idx + hue_step) % _HUE_STEPS
+            if clock.wait(): break
 
 # Available effects list for EffectManager
 # Available effects list for EffectManager
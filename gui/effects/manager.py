@@ -4,10 +4,10 @@
 import logging
 import threading
 import time
-from typing import Callable, Dict, Any, Optional, List
+from typing import Callable, Dict, Any, Optional, List, Tuple
 
 from ..core.rgb_color import RGBColor
-from ..core.constants import default_settings, NUM_ZONES
+from ..core.constants import default_settings, NUM_ZONES, ZONE_GRADIENT_RATIOS
 from ..hardware.controller import HardwareController
 from .library import EffectLibrary, AVAILABLE_EFFECTS
 
@@ -19,7 +19,14 @@ class EffectManager:
         self.hardware = hardware_controller
         self.settings = settings_manager
         self.current_effect_name: Optional[str] = None
+        # Animated effects run one after another on a single long-lived worker thread
+        # (started on first use) instead of a new thread per effect
         self.effect_thread: Optional[threading.Thread] = None
+        self._effect_cond = threading.Condition(threading.Lock())
+        self._queued_effect: Optional[Tuple[Callable, Dict[str, Any]]] = None
+        self._effect_running = False # The worker is inside an effect function (not just queued)
+        # One Event for every effect run, never replaced: stop_current_effect() sets it and
+        # joins the thread, start_effect() clears it before the next effect starts
         self.stop_event = threading.Event()
         self.current_effect_params: Dict[str, Any] = {}
         self._is_effect_running_flag = False 
@@ -67,9 +74,9 @@ class EffectManager:
         
         success = self.hardware.set_all_leds_color(color)
         if success:
-            self.logger.info(f"Applied static color {color.to_hex()} to all zones")
+            self.logger.info("Applied static color %s to all zones", color.to_hex())
         else:
-            self.logger.error(f"Failed to apply static color {color.to_hex()}")
+            self.logger.error("Failed to apply static color %s", color.to_hex())
         return success
 
     def _apply_static_zone_colors(self, **kwargs):
@@ -131,12 +138,7 @@ class EffectManager:
             end_color = RGBColor.from_dict(end_color)
         
         zone_colors = []
-        for i in range(NUM_ZONES):
-            if NUM_ZONES > 1:
-                ratio = i / (NUM_ZONES - 1)
-            else:
-                ratio = 0
-            
+        for ratio in ZONE_GRADIENT_RATIOS:
             # Interpolate between start and end colors
             r = int(start_color.r * (1 - ratio) + end_color.r * ratio)
             g = int(start_color.g * (1 - ratio) + end_color.g * ratio)
@@ -145,7 +147,7 @@ class EffectManager:
         
         success = self.hardware.set_zone_colors(zone_colors)
         if success:
-            self.logger.info(f"Applied static gradient from {start_color.to_hex()} to {end_color.to_hex()}")
+            self.logger.info("Applied static gradient from %s to %s", start_color.to_hex(), end_color.to_hex())
         else:
             self.logger.error("Failed to apply static gradient")
         return success
@@ -168,7 +170,7 @@ class EffectManager:
             return True
 
         if effect_name not in self.effect_map:
-            self.logger.error(f"Effect '{effect_name}' not found in effect map.")
+            self.logger.error("Effect '%s' not found in effect map.", effect_name)
             return False
 
         # Stop any currently running effect
@@ -189,7 +191,7 @@ class EffectManager:
         static_effects = ["Static Color", "Static Zone Colors", "Static Rainbow", "Static Gradient"]
 
         if effect_name in static_effects:
-            self.logger.info(f"Applying static effect: {effect_name} with params: {params}")
+            self.logger.info("Applying static effect: %s with params: %s", effect_name, params)
             try:
                 success = effect_func(**params)
                 # Static effects don't continuously run, so don't mark as "effect running"
@@ -201,12 +203,12 @@ class EffectManager:
                     self.hardware.set_effect_running_status(False)
                 return success
             except Exception as e:
-                self.logger.error(f"Error applying static effect '{effect_name}': {e}", exc_info=True)
+                self.logger.error("Error applying static effect '%s': %s", effect_name, e, exc_info=True)
                 return False
 
         # Handle reactive effects specially
         if effect_name in ["Reactive", "Anti-Reactive"]:
-            self.logger.info(f"Starting reactive effect: {effect_name}")
+            self.logger.info("Starting reactive effect: %s", effect_name)
             
             # Stop any existing effects first
             self.stop_current_effect()
@@ -240,14 +242,14 @@ class EffectManager:
                     
                     return True
                 else:
-                    self.logger.error(f"Failed to enable reactive mode for {effect_name}")
+                    self.logger.error("Failed to enable reactive mode for %s", effect_name)
                     return False
             else:
                 self.logger.warning("Hardware does not support reactive mode")
                 return False
         else: 
             # Animated effects run in a thread - this is where Goal 2A is crucial
-            self.logger.info(f"Starting animated effect: {effect_name} with params: {params}")
+            self.logger.info("Starting animated effect: %s with params: %s", effect_name, params)
             
             # Prepare parameters for the effect function
             thread_kwargs = params.copy()
@@ -257,38 +259,60 @@ class EffectManager:
                 default_color_hex = default_settings.get('effect_color', "#FFFFFF")
                 thread_kwargs['color'] = RGBColor.from_hex(default_color_hex)
 
-            # Create and start the effect thread
-            self.effect_thread = threading.Thread(
-                target=self._run_animated_effect, 
-                args=(effect_func, thread_kwargs),
-                daemon=True,
-                name=f"EffectThread-{effect_name}"
-            )
-            
             try:
-                self.effect_thread.start()
+                self._ensure_effect_worker()
+                with self._effect_cond:
+                    self._queued_effect = (effect_func, thread_kwargs)
+                    self._effect_cond.notify_all()
                 self._is_effect_running_flag = True
                 # CRITICAL for Goal 2A: Inform hardware controller that an effect is running
                 # This prevents LED clearing when GUI is hidden to tray
                 if hasattr(self.hardware, 'set_effect_running_status'):
                     self.hardware.set_effect_running_status(True)
-                    self.logger.debug(f"Informed hardware controller that effect '{effect_name}' is running")
+                    self.logger.debug("Informed hardware controller that effect '%s' is running", effect_name)
                 return True
             except Exception as e:
-                 self.logger.error(f"Failed to start thread for effect '{effect_name}': {e}", exc_info=True)
+                 self.logger.error("Failed to start worker for effect '%s': %s", effect_name, e, exc_info=True)
                  self.current_effect_name = None
                  self._is_effect_running_flag = False
                  if hasattr(self.hardware, 'set_effect_running_status'):
                      self.hardware.set_effect_running_status(False)
                  return False
 
+    def _ensure_effect_worker(self):
+        if self.effect_thread is None or not self.effect_thread.is_alive():
+            self.effect_thread = threading.Thread(target=self._effect_worker_loop, daemon=True, name="EffectWorker")
+            self.effect_thread.start()
+
+    def _effect_worker_loop(self):
+        """Run queued animated effects for as long as this thread is the manager's worker."""
+        me = threading.current_thread()
+        while True:
+            with self._effect_cond:
+                while self._queued_effect is None:
+                    if self.effect_thread is not me:
+                        return
+                    self._effect_cond.wait()
+                if self.effect_thread is not me:
+                    return
+                effect_func, params = self._queued_effect
+                self._queued_effect = None
+                self._effect_running = True
+            try:
+                self._run_animated_effect(effect_func, params)
+            finally:
+                with self._effect_cond:
+                    if self.effect_thread is me:
+                        self._effect_running = False
+                    self._effect_cond.notify_all()
+
     def _run_animated_effect(self, effect_func: Callable, params: Dict[str, Any]):
         """Run an animated effect in a thread"""
         try:
-            self.logger.info(f"Starting animated effect thread with params: {params}")
+            self.logger.info("Starting animated effect thread with params: %s", params)
             effect_func(self.stop_event, self.hardware, **params)
         except Exception as e:
-            self.logger.error(f"Error in animated effect: {e}", exc_info=True)
+            self.logger.error("Error in animated effect: %s", e, exc_info=True)
         finally:
             self.logger.info("Animated effect thread finished")
             self._is_effect_running_flag = False
@@ -299,17 +323,20 @@ class EffectManager:
 
     def stop_current_effect(self) -> None:
         """Stop the currently running effect - implements Goal 2A hardware status communication"""
-        if self.effect_thread and self.effect_thread.is_alive():
-            self.logger.info(f"Stopping current effect: {self.current_effect_name}")
-            self.stop_event.set()
-            try:
-                self.effect_thread.join(timeout=2.0)  # Increased timeout
-                if self.effect_thread.is_alive():
-                    self.logger.warning(f"Effect thread for '{self.current_effect_name}' did not join cleanly.")
-            except Exception as e:
-                self.logger.error(f"Error joining effect thread: {e}", exc_info=True)
-        
-        self.effect_thread = None
+        with self._effect_cond:
+            # A job the worker has not picked up yet is simply dropped; only an effect
+            # that is actually running needs stopping and waiting for
+            self._queued_effect = None
+            if self._effect_running:
+                self.logger.info("Stopping current effect: %s", self.current_effect_name)
+                self.stop_event.set()
+                if not self._effect_cond.wait_for(lambda: not self._effect_running, timeout=2.0):
+                    # Leave the stuck effect behind: the worker retires once it returns and
+                    # the next effect gets a fresh worker instead of queueing behind it
+                    self.logger.warning("Effect '%s' did not stop cleanly; abandoning its worker.", self.current_effect_name)
+                    self.effect_thread = None
+                    self._effect_running = False
+                    self._effect_cond.notify_all()
         # Stop reactive mode if active
         if self.current_effect_name in ["Reactive", "Anti-Reactive"]:
             if hasattr(self.hardware, 'set_reactive_mode'):
@@ -325,13 +352,13 @@ class EffectManager:
 
     def is_effect_running(self) -> bool:
         """Check if an effect is currently running"""
-        return self._is_effect_running_flag and bool(self.effect_thread and self.effect_thread.is_alive())
+        return self._is_effect_running_flag and (self._effect_running or self._queued_effect is not None)
 
     def update_effect_speed(self, new_speed: int):
         """Update the speed of the currently running effect"""
         if self.is_effect_running() and self.current_effect_name:
             validated_speed = max(1, min(10, new_speed))
-            self.logger.info(f"Updating speed for effect '{self.current_effect_name}' to {validated_speed}.")
+            self.logger.info("Updating speed for effect '%s' to %s.", self.current_effect_name, validated_speed)
             updated_params = self.current_effect_params.copy()
             updated_params["speed"] = validated_speed
             self.start_effect(self.current_effect_name, **updated_params)
@@ -343,7 +370,7 @@ class EffectManager:
         if self.is_effect_running() and self.current_effect_name and \
            not self.current_effect_params.get("rainbow_mode", False):
             
-            self.logger.info(f"Updating color for effect '{self.current_effect_name}' to {new_color.to_hex()}.")
+            self.logger.info("Updating color for effect '%s' to %s.", self.current_effect_name, new_color.to_hex())
             updated_params = self.current_effect_params.copy()
             updated_params["color"] = new_color
             self.start_effect(self.current_effect_name, **updated_params)
@@ -352,7 +379,7 @@ class EffectManager:
 
     def _run_reactive_simulation(self, effect_name: str):
         """Run reactive effect simulation for testing"""
-        self.logger.info(f"Starting reactive simulation for {effect_name}")
+        self.logger.info("Starting reactive simulation for %s", effect_name)
         
         try:
             while self._is_effect_running_flag and self.current_effect_name == effect_name:
@@ -360,7 +387,7 @@ class EffectManager:
                     self.hardware.simulate_key_press_pattern("typing")
                 time.sleep(2.0)  # Repeat every 2 seconds
         except Exception as e:
-            self.logger.error(f"Error in reactive simulation: {e}")
+            self.logger.error("Error in reactive simulation: %s", e)
         finally:
             self.logger.info("Reactive simulation ended")
 
@@ -369,7 +396,7 @@ class EffectManager:
         if self.is_effect_running() and self.current_effect_name and \
            self.effect_supports_rainbow(self.current_effect_name):
             
-            self.logger.info(f"Toggling rainbow mode to {rainbow_on} for effect '{self.current_effect_name}'.")
+            self.logger.info("Toggling rainbow mode to %s for effect '%s'.", rainbow_on, self.current_effect_name)
             updated_params = self.current_effect_params.copy()
             updated_params["rainbow_mode"] = rainbow_on
             
@@ -3,7 +3,10 @@ import logging
 import os
 import threading
 import time
-import colorsys
+import shutil
+
+from ..core.exceptions import HardwareError
+from ..utils.safe_subprocess import EctoolSession, run_batch
 
 try:
     import keyboard
@@ -11,7 +14,86 @@ try:
 except ImportError:
     KB_AVAIL = False
 
+ECTOOL_EXECUTABLE = '/usr/local/bin/ectool'
+
+def _find_ectool(preferred=ECTOOL_EXECUTABLE):
+    """Return the preferred ectool path if executable, else whatever is on $PATH (or None)."""
+    if os.path.isfile(preferred) and os.access(preferred, os.X_OK):
+        return preferred
+    # Pure-Python $PATH scan; no 'which' subprocess
+    return shutil.which('ectool')
+
+# Probed once at import; every controller instance (and every command) reuses it
+_ECTOOL_FOUND_PATH = _find_ectool()
+_ECTOOL_EXISTS = _ECTOOL_FOUND_PATH is not None
+
+# keyboard-library key name -> hardware column; consulted on every key press
+_KEY_TO_COLUMN = {
+    'esc':1, '`':1, 'tab':1, 'caps lock':1, 'shift':1, 'ctrl':1, '1':1, 'q':1, 'a':1, 'z':1,
+    '2':2, 'w':2, 's':2, 'x':2, 'alt':2,
+    '3':4, 'e':4, 'd':4, 'c':4,
+    '4':5, 'r':5, 'f':5, 'v':5,
+    '5':6, 't':6, 'g':6, 'b':6,
+    '6':7, 'y':7, 'h':7, 'n':7, 'space':7,
+    '7':8, 'u':8, 'j':8, 'm':8,
+    '8':9, 'i':9, 'k':9, ',':9,
+    '9':10, 'o':10, 'l':10, '.':10, 'alt gr':10,
+    '0':11, 'p':11, ';':11, '/':11, '-':11, '[':11, '\'':11,
+    '=':12, 'backspace':12, ']':12, '\\':12, 'enter':12, 'right shift':12, 'up':12, 'down':12, 'left':12, 'right':12
+}
+
+def _color_arg(color_obj):
+    """Format a colour as the 0xRRGGBB argument rgbkbd expects."""
+    try:
+        # One C-level pack of the three bytes instead of shifting/or-ing in Python
+        return "0x%06x" % int.from_bytes(bytes((color_obj.r, color_obj.g, color_obj.b)), 'big')
+    except (AttributeError, TypeError, ValueError):
+        hex_color = color_obj.to_hex() if hasattr(color_obj, 'to_hex') else str(color_obj)
+        return f"0x{hex_color.lstrip('#')}"
+
+# Hardware columns behind each of the four GUI zones
+_ZONE_COLUMNS = ((1, 2), (4, 5, 6), (7, 8, 9), (10, 11, 12))
+
+def _coalesce_column_runs(column_colors):
+    """
+    Turn {col: '0xRRGGBB'} into rgbkbd commands, one per run of consecutive
+    columns: 'rgbkbd <start> <c1> <c2> ...' sets <start>, <start>+1, ... in one
+    ectool call. A full-board update (columns 1-2 and 4-12) becomes two commands.
+    """
+    commands = []
+    prev = None
+    run = None
+    for col in sorted(column_colors):
+        if prev is not None and col == prev + 1:
+            run.append(column_colors[col])
+        else:
+            run = [column_colors[col]]
+            commands.append((col, run))
+        prev = col
+    return [['rgbkbd', str(start)] + colors for start, colors in commands]
+
+# Fully saturated hue -> RGB by sextant: one channel is full, one ramps, one is off.
+# (full channel shift, ramp channel shift) per sextant; ramp rises in even sextants,
+# falls in odd ones (same as colorsys.hsv_to_rgb at s = v = 1).
+_SEXTANT_SHIFTS = ((16, 8), (8, 16), (8, 0), (0, 8), (0, 16), (16, 0))
+
+def _rainbow_packed(hue):
+    """0xRRGGBB for hue in [0, 1) at full saturation/value, integer math after one scale."""
+    h6 = (hue % 1.0) * 6.0
+    sextant = int(h6)
+    frac = h6 - sextant
+    ramp = int((1.0 - frac) * 255) if sextant & 1 else int(frac * 255)
+    full_shift, ramp_shift = _SEXTANT_SHIFTS[sextant]
+    return (0xFF << full_shift) | (ramp << ramp_shift)
+
+# Columns whose colour matches what was last sent are skipped by the writer; every
+# this many seconds a batch goes out unfiltered so the EC is re-synced even if
+# something else (another ectool user, an EC reset) changed the LEDs.
+_COLUMN_REFRESH_INTERVAL = 2.0
+
 class InternalColor:
+    __slots__ = ('r', 'g', 'b')
+
     def __init__(self, r, g, b):
         self.r, self.g, self.b = r, g, b
     def to_hex(self):
@@ -22,7 +104,11 @@ class HardwareController:
         self.logger = logger or logging.getLogger(__name__)
         self.active_method = 'ectool'
         self.hardware_ready = True
-        self._ectool_path = '/usr/local/bin/ectool'
+        self._ectool_path = _ECTOOL_FOUND_PATH or ECTOOL_EXECUTABLE
+        self._ectool_available = _ECTOOL_EXISTS
+        # On the Osiris EC 'rgbkbd demo 0' already leaves every column dark, so a
+        # successful stop needs no follow-up per-column clear.
+        self._demo0_clears_leds = True
         self.detection_complete = threading.Event()
         self.detection_complete.set()
         
@@ -32,9 +118,25 @@ class HardwareController:
         self.react_thread = None
         
         self.column_indices = [1, 2, 4, 5, 6, 7, 8, 9, 10, 11, 12]
-        self.col_state = {col: False for col in self.column_indices}
-        self.col_timers = {col: 0 for col in self.column_indices}
+        self.col_state = dict.fromkeys(self.column_indices, False)
+        self.col_timers = dict.fromkeys(self.column_indices, 0)
         self.react_lock = threading.Lock()
+        # Key presses notify this so the reactive loop only wakes for a press or an expiry
+        self._react_cond = threading.Condition(self.react_lock)
+
+        # Colour writes are handed to a single writer thread so effect loops never
+        # block on ectool. Pending writes are keyed by column: a newer colour for a
+        # column replaces one that has not been sent yet instead of queueing behind it.
+        self._pending_columns = {}
+        # {col: '0xRRGGBB'} last confirmed sent per column (guarded by _pending_cond)
+        self._sent_columns = {}
+        self._ectool_session = EctoolSession(self._ectool_path)
+        self._writer_busy = False
+        self._writer_stop = False # Set by shutdown(); the writer exits once the queue is drained
+        # Condition() defaults to an RLock; nothing re-enters it, so use a plain Lock
+        self._pending_cond = threading.Condition(threading.Lock())
+        self._writer_thread = threading.Thread(target=self._column_writer_loop, daemon=True, name="EctoolWriter")
+        self._writer_thread.start()
 
     def wait_for_detection(self, timeout=10, preferred_method=None): return True
     def is_operational(self): return True
@@ -42,29 +144,174 @@ class HardwareController:
     @property
     def active_control_method(self): return self.active_method
 
+    def _detect_ectool(self, refresh=False):
+        if refresh:
+            found = _find_ectool(self._ectool_path)
+            self._ectool_available = found is not None
+            if found:
+                self._ectool_path = found
+            self._ectool_session.ectool_path = self._ectool_path
+            self._set_sent_columns(None)
+        if self._ectool_available:
+            self.logger.info("ectool found at %s", self._ectool_path)
+        else:
+            self.logger.warning("ectool not found or not executable at %s", self._ectool_path)
+        return self._ectool_available
+
     def _run_ectool_cmd(self, cmd_args):
+        if not self._ectool_available:
+            return False, f"ectool not available at {self._ectool_path}"
+        try:
+            # Same long-lived shell the writer thread uses: a pipe round trip, no fork from Python
+            if self._ectool_session.send_batch([cmd_args])[0]:
+                return True, ""
+            return False, f"ectool {' '.join(cmd_args)} exited with an error"
+        except HardwareError as e:
+            self.logger.debug("ectool session unavailable (%s), running command directly", e)
+        return self._run_ectool_subprocess(cmd_args)
+
+    def _run_ectool_subprocess(self, cmd_args):
         try:
             full_cmd = [self._ectool_path] + cmd_args
+            # subprocess.run only returns once ectool has exited, i.e. the EC has taken the
+            # command; no settle delay needed after it
             subprocess.run(full_cmd, capture_output=True, text=True, check=True)
-            # Lightning-fast 5ms delay allows us to broadcast all 11 columns instantly
-            time.sleep(0.005) 
             return True, ""
         except Exception as e:
             return False, str(e)
 
+    def _queue_column_color(self, col, hex_arg):
+        with self._pending_cond:
+            self._queue_column_color_locked(col, hex_arg)
+            self._pending_cond.notify_all()
+
+    def _queue_column_color_locked(self, col, hex_arg):
+        # Caller must hold self._pending_cond
+        self._pending_columns[col] = hex_arg
+
+    def _column_writer_loop(self):
+        last_refresh = time.monotonic()
+        while True:
+            with self._pending_cond:
+                while True:
+                    while not self._pending_columns:
+                        self._writer_busy = False
+                        self._pending_cond.notify_all()
+                        if self._writer_stop:
+                            return
+                        self._pending_cond.wait()
+                    batch = self._pending_columns
+                    self._pending_columns = {}
+                    now = time.monotonic()
+                    if now - last_refresh >= _COLUMN_REFRESH_INTERVAL:
+                        last_refresh = now
+                    else:
+                        # Slow effects re-queue the same colours most frames; don't resend them
+                        sent = self._sent_columns
+                        batch = {col: arg for col, arg in batch.items() if sent.get(col) != arg}
+                    if batch:
+                        break
+                self._writer_busy = True
+            ok = self._send_column_batch(_coalesce_column_runs(batch))
+            with self._pending_cond:
+                if ok:
+                    self._sent_columns.update(batch)
+                else:
+                    for col in batch:
+                        self._sent_columns.pop(col, None)
+
+    def _set_sent_columns(self, color_arg=None):
+        # Record what the LEDs now show after a command that bypassed the writer;
+        # None means unknown, so the next frame is sent in full
+        with self._pending_cond:
+            self._sent_columns = {} if color_arg is None else dict.fromkeys(self.column_indices, color_arg)
+
+    def _send_column_batch(self, commands):
+        """Send coalesced rgbkbd commands; True only if every one succeeded."""
+        if not self._ectool_available:
+            return False
+        try:
+            # One pipe write to the long-lived session instead of a subprocess per column
+            results = self._ectool_session.send_batch(commands)
+        except HardwareError as e:
+            self.logger.debug("ectool session unavailable (%s), running batch through one shell", e)
+            try:
+                # Still one fork for the whole batch rather than one per column
+                results = [rc == 0 for rc, _ in run_batch([[self._ectool_path] + cmd for cmd in commands])]
+            except HardwareError as batch_err:
+                self.logger.debug("ectool batch failed (%s), running commands individually", batch_err)
+                results = [self._run_ectool_subprocess(cmd)[0] for cmd in commands]
+        all_ok = len(results) == len(commands)
+        for cmd, ok in zip(commands, results):
+            if not ok:
+                all_ok = False
+                self.logger.debug("ectool %s failed", ' '.join(cmd))
+        return all_ok
+
+    def flush_pending_writes(self, timeout=1.0):
+        """Block until queued colour writes have reached ectool. Returns False on timeout."""
+        deadline = time.monotonic() + timeout
+        with self._pending_cond:
+            while self._pending_columns or self._writer_busy:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    return False
+                self._pending_cond.wait(remaining)
+        return True
+
+    def shutdown(self, timeout=1.0):
+        """Stop the reactive engine, let the writer drain and exit, then close the ectool session."""
+        self.stop_reactive_mode()
+        with self._pending_cond:
+            self._writer_stop = True
+            self._pending_cond.notify_all()
+        thread = self._writer_thread
+        if thread.is_alive() and thread is not threading.current_thread():
+            thread.join(timeout)
+            if thread.is_alive():
+                self.logger.warning("ectool writer thread did not exit during shutdown.")
+        self._ectool_session.close()
+
+    def _queue_columns(self, column_args):
+        # {col: '0xRRGGBB'} for several columns at once
+        with self._pending_cond:
+            self._pending_columns.update(column_args)
+            self._pending_cond.notify_all()
+
+    def _queue_all_columns(self, color_arg):
+        self._queue_columns(dict.fromkeys(self.column_indices, color_arg))
+
     def set_all_leds_color(self, color_obj):
-        hex_color = color_obj.to_hex().lstrip('#') if hasattr(color_obj, 'to_hex') else str(color_obj).lstrip('#')
-        for zone in self.column_indices:
-            self._run_ectool_cmd(['rgbkbd', str(zone), f"0x{hex_color}"])
+        self._queue_all_columns(_color_arg(color_obj))
+        return True
+
+    def set_all_leds_color_packed(self, packed_rgb):
+        """Per-frame variant of set_all_leds_color for effects: takes a 0xRRGGBB int, no colour object."""
+        self._queue_all_columns("0x%06x" % packed_rgb)
         return True
 
     def set_zone_colors(self, colors_list):
-        hw_mapping = {0: [1, 2], 1: [4, 5, 6], 2: [7, 8, 9], 3: [10, 11, 12]}
-        for gui_idx, hw_zones in hw_mapping.items():
-            if gui_idx < len(colors_list):
-                hex_color = colors_list[gui_idx].to_hex().lstrip('#')
+        with self._pending_cond:
+            for gui_idx, hw_zones in enumerate(_ZONE_COLUMNS[:len(colors_list)]):
+                color_arg = _color_arg(colors_list[gui_idx])
                 for zone in hw_zones:
-                    self._run_ectool_cmd(['rgbkbd', str(zone), f"0x{hex_color}"])
+                    self._queue_column_color_locked(zone, color_arg)
+            self._pending_cond.notify_all()
+        return True
+
+    def set_zone_colors_buffer(self, zone_rgb):
+        """
+        Per-frame variant of set_zone_colors for effects: takes one flat buffer of
+        R, G, B bytes per zone (bytes, a reused bytearray, a uint8 array...) instead
+        of a list of colour objects.
+        """
+        data = bytes(zone_rgb)
+        with self._pending_cond:
+            for gui_idx, hw_zones in enumerate(_ZONE_COLUMNS[:len(data) // 3]):
+                color_arg = "0x" + data[gui_idx * 3:gui_idx * 3 + 3].hex()
+                for zone in hw_zones:
+                    self._queue_column_color_locked(zone, color_arg)
+            self._pending_cond.notify_all()
         return True
 
     def set_brightness(self, value):
@@ -74,34 +321,45 @@ class HardwareController:
         return True
 
     def clear_all_leds(self):
-        for zone in self.column_indices:
-            self._run_ectool_cmd(['rgbkbd', str(zone), '0x000000'])
+        # An explicit clear always goes out, whatever the writer believes was last sent
+        self._set_sent_columns(None)
+        self._queue_all_columns('0x000000')
+        # Callers clear right before shutdown, so wait for the writer to catch up
+        self.flush_pending_writes()
         return True
 
+    def _drop_pending_writes(self):
+        with self._pending_cond:
+            self._pending_columns.clear()
+
     def attempt_stop_hardware_effects(self):
         self.stop_reactive_mode()
-        self._run_ectool_cmd(['rgbkbd', 'demo', '0'])
-        return True
+        # Frames still waiting for the writer belong to the effect being stopped
+        self._drop_pending_writes()
+        ok, err = self._run_ectool_cmd(['rgbkbd', 'demo', '0'])
+        if ok and self._demo0_clears_leds:
+            self._set_sent_columns('0x000000')
+            return True
+        self._set_sent_columns(None)
+        if not ok:
+            self.logger.debug("rgbkbd demo 0 failed (%s), clearing columns instead", err)
+        return self.clear_all_leds()
 
     def _get_col_for_key(self, key_name):
-        k = str(key_name).lower()
-        mapping = {
-            'esc':1, '`':1, 'tab':1, 'caps lock':1, 'shift':1, 'ctrl':1, '1':1, 'q':1, 'a':1, 'z':1,
-            '2':2, 'w':2, 's':2, 'x':2, 'alt':2,
-            '3':4, 'e':4, 'd':4, 'c':4,
-            '4':5, 'r':5, 'f':5, 'v':5,
-            '5':6, 't':6, 'g':6, 'b':6,
-            '6':7, 'y':7, 'h':7, 'n':7, 'space':7,
-            '7':8, 'u':8, 'j':8, 'm':8,
-            '8':9, 'i':9, 'k':9, ',':9,
-            '9':10, 'o':10, 'l':10, '.':10, 'alt gr':10,
-            '0':11, 'p':11, ';':11, '/':11, '-':11, '[':11, '\'':11,
-            '=':12, 'backspace':12, ']':12, '\\':12, 'enter':12, 'right shift':12, 'up':12, 'down':12, 'left':12, 'right':12
-        }
-        return mapping.get(k, 7)
+        return _KEY_TO_COLUMN.get(str(key_name).lower(), 7)
 
     def stop_reactive_mode(self):
         self.reactive_active = False
+        with self._react_cond:
+            self._react_cond.notify_all()
+        thread, self.react_thread = self.react_thread, None
+        if thread is not None and thread is not threading.current_thread():
+            # The loop wakes on the notify above and exits at once; a slow join means it is stuck
+            thread.join(timeout=0.1)
+            if thread.is_alive():
+                # Keep the reference so start_reactive_mode will not launch a second engine
+                self.react_thread = thread
+                self.logger.warning("Reactive engine thread did not exit after being stopped.")
         if self._kb_hook and KB_AVAIL:
             try: keyboard.unhook(self._kb_hook)
             except: pass
@@ -112,6 +370,9 @@ class HardwareController:
         if not KB_AVAIL:
             self.logger.error("keyboard library missing! Cannot start reactive.")
             return
+        if self.react_thread is not None and self.react_thread.is_alive():
+            self.logger.error("Previous reactive engine is still running; not starting another.")
+            return
         
         self.reactive_active = True
         self.reactive_mode = mode
@@ -119,8 +380,8 @@ class HardwareController:
         self.react_rainbow = is_rainbow
         
         with self.react_lock:
-            self.col_state = {col: False for col in self.column_indices}
-            self.col_timers = {col: 0 for col in self.column_indices}
+            self.col_state = dict.fromkeys(self.column_indices, False)
+            self.col_timers = dict.fromkeys(self.column_indices, 0)
         
         if mode == "Anti-Reactive":
             self.set_all_leds_color(color_obj if not is_rainbow else InternalColor(255,255,255))
@@ -130,44 +391,56 @@ class HardwareController:
         def on_key(e):
             if e.event_type == keyboard.KEY_DOWN:
                 col = self._get_col_for_key(e.name)
-                with self.react_lock:
-                    self.col_timers[col] = time.time() + 0.35 
+                with self._react_cond:
+                    self.col_timers[col] = time.monotonic() + 0.35
+                    self._react_cond.notify()
         
         self._kb_hook = keyboard.hook(on_key)
         self.react_thread = threading.Thread(target=self._reactive_engine_loop, daemon=True)
         self.react_thread.start()
-        self.logger.info(f"Total-Matrix Engine Started: {mode}")
+        self.logger.info("Total-Matrix Engine Started: %s", mode)
 
     def _reactive_engine_loop(self):
-        while self.reactive_active:
-            time.sleep(0.01)
-            now = time.time()
-            board_needs_update = False
-            
-            with self.react_lock:
+        cond = self._react_cond
+        while True:
+            with cond:
+                # Checked under the lock so a stop's notify cannot slip in before the wait
+                if not self.reactive_active:
+                    break
+                now = time.monotonic()
+                board_needs_update = False
+                next_expiry = None
                 for col in self.column_indices:
-                    is_active = now < self.col_timers[col]
+                    lit_until = self.col_timers[col]
+                    is_active = now < lit_until
                     if is_active != self.col_state[col]:
                         self.col_state[col] = is_active
                         board_needs_update = True
-                        
+                    if is_active and (next_expiry is None or lit_until < next_expiry):
+                        next_expiry = lit_until
+                if not board_needs_update:
+                    # Nothing changed: sleep until a key press notifies us or the next
+                    # lit column times out, instead of polling every 10 ms
+                    cond.wait(None if next_expiry is None else next_expiry - now)
+                    continue
+
             # If ANY key changed state, broadcast the exact map to ALL 11 columns
-            if board_needs_update:
-                for col in self.column_indices:
-                    if not self.reactive_active: break
-                    is_active = self.col_state[col]
-                    
-                    c = self.react_color
-                    if self.react_rainbow:
-                        rgb = colorsys.hsv_to_rgb((now * 0.5 + col*0.05) % 1.0, 1.0, 1.0)
-                        c = InternalColor(int(rgb[0]*255), int(rgb[1]*255), int(rgb[2]*255))
-                    
-                    if self.reactive_mode == "Reactive":
-                        target_hex = f"0x{c.to_hex().lstrip('#')}" if is_active else "0x000000"
+            frame = {}
+            lit_when_active = self.reactive_mode == "Reactive"
+            rainbow = self.react_rainbow
+            # A fixed colour is the same argument for every column: format it once per frame
+            color_arg = None if rainbow else _color_arg(self.react_color)
+            for col in self.column_indices:
+                if self.col_state[col] == lit_when_active:
+                    if rainbow:
+                        frame[col] = "0x%06x" % _rainbow_packed(now * 0.5 + col*0.05)
                     else:
-                        target_hex = "0x000000" if is_active else f"0x{c.to_hex().lstrip('#')}"
-                        
-                    self._run_ectool_cmd(['rgbkbd', str(col), target_hex])
+                        frame[col] = color_arg
+                else:
+                    frame[col] = "0x000000"
+            # Hand the whole frame to the writer under one lock acquisition
+            if self.reactive_active:
+                self._queue_columns(frame)
 
     def get_hardware_info(self): return {"Status": "Total-Matrix Reactive Active"}
     def get_brightness(self): return None
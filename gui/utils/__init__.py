@@ -8,7 +8,7 @@ This file makes 'utils' a Python package.
 from .system_info import log_system_info, get_system_info_string, log_error_with_context
 from .decorators import safe_execute, CircuitBreaker # Added CircuitBreaker to exports
 from .input_validation import SafeInputValidation
-from .safe_subprocess import run_command # Export run_command directly
+from .safe_subprocess import run_command, run_batch, EctoolSession # Export run_command directly
 
 __all__ = [
     "log_system_info",
@@ -17,6 +17,8 @@ __all__ = [
     "safe_execute",
     "CircuitBreaker", # Added
     "SafeInputValidation",
-    "run_command" # Added
+    "run_command", # Added
+    "run_batch",
+    "EctoolSession"
 ]
 
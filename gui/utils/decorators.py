@@ -3,9 +3,11 @@
 import functools
 import time
 import logging
-import threading # Added for CircuitBreaker's RLock
+import threading # Added for CircuitBreaker's lock
 from typing import Callable, Any, Optional
 
+from ..core.constants import RETRY_DELAY_BASE
+
 # Note: The ErrorSeverity and ErrorContext classes below are local stubs.
 # If your project has centralized, more feature-rich versions (e.g., ErrorSeverity as an Enum),
 # consider importing and using those for better consistency and type safety across the application.
@@ -17,7 +19,13 @@ class ErrorSeverity: # Simplified stub, functional for this decorator's string c
     HIGH = "high"
     CRITICAL = "critical"
 
+# Backoff delays indexed by (attempt - 1): a lookup instead of a pow/multiply/min per retry
+_MAX_RETRY_DELAY = 10.0
+_RETRY_DELAY_TABLE = tuple(min(RETRY_DELAY_BASE * (1 << i), _MAX_RETRY_DELAY) for i in range(32))
+
 class ErrorContext: # Simplified stub
+    __slots__ = ('component', 'operation', 'attempt', 'max_attempts', 'severity', 'last_error')
+
     def __init__(self, component, operation, max_attempts, severity):
         self.component = component
         self.operation = operation
@@ -25,9 +33,9 @@ class ErrorContext: # Simplified stub
         self.max_attempts = max_attempts
         self.severity = severity # Should align with string values from ErrorSeverity class
         self.last_error = None
-        self.error_count = 0
-    def should_retry(self): return self.attempt < self.max_attempts # Simplified retry logic
-    def get_retry_delay(self): return 0.5 * (2**(self.attempt - 1))
+    # error_count tracked attempt one-for-one, so attempt alone decides; critical failures never retry
+    def should_retry(self): return self.attempt < self.max_attempts and self.severity != ErrorSeverity.CRITICAL
+    def get_retry_delay(self): return _RETRY_DELAY_TABLE[min(self.attempt - 1, len(_RETRY_DELAY_TABLE) - 1)]
 
 
 def safe_execute(max_attempts: int = 3, 
@@ -39,9 +47,11 @@ def safe_execute(max_attempts: int = 3,
     A robust decorator for safe execution with retry logic, exponential backoff,
     and detailed logging.
     """
+    # Per-decoration backoff table; retries index it instead of recomputing the power
+    retry_delays = tuple(min(initial_delay * (1 << i), max_delay) for i in range(max(max_attempts, 1)))
+
     def decorator(func: Callable) -> Callable:
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs) -> Optional[Any]:
+        def get_logger(args: tuple) -> logging.Logger:
             component_name = func.__module__ or "unknown_module"
             # Attempt to get class name if 'self' or 'cls' is the first argument
             if args:
@@ -50,38 +60,44 @@ def safe_execute(max_attempts: int = 3,
                     component_name = first_arg.__class__.__name__
                 elif isinstance(first_arg, type): # It's a class itself (for classmethods)
                     component_name = first_arg.__name__
-            
-            logger = logging.getLogger(f"{component_name}.{func.__name__}")
-            
-            current_attempt = 0
-            last_exception: Optional[Exception] = None
+            return logging.getLogger(f"{component_name}.{func.__name__}")
+
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs) -> Optional[Any]:
+            # First-attempt success is the overwhelming case, so it pays for nothing
+            # but the try block; logger lookup and retry state only exist after a failure.
+            try:
+                return func(*args, **kwargs)
+            except exception_to_catch as e:
+                last_exception = e
+
+            logger = get_logger(args)
+            current_attempt = 1
+            while True:
+                log_level = logging.WARNING if current_attempt < max_attempts else logging.ERROR
+                # Check against string values of the local ErrorSeverity class
+                if severity == ErrorSeverity.CRITICAL and current_attempt >= max_attempts :
+                     log_level = logging.CRITICAL
+                
+                logger.log(log_level,
+                           "Attempt %d/%d for '%s' failed: %s - %s", current_attempt, max_attempts, func.__name__, type(last_exception).__name__, last_exception,
+                           exc_info=last_exception if log_level >= logging.ERROR else None)
 
-            while current_attempt < max_attempts:
+                if current_attempt >= max_attempts:
+                    if severity == ErrorSeverity.CRITICAL:
+                        logger.critical("Critical operation '%s' failed definitively after %s attempts.", func.__name__, max_attempts)
+                        raise last_exception
+                    logger.error("Operation '%s' failed after %s attempts.", func.__name__, max_attempts)
+                    return None
+
+                delay = retry_delays[current_attempt - 1]
+                logger.info("Retrying '%s' in %.2fs...", func.__name__, delay)
+                time.sleep(delay)
                 current_attempt += 1
                 try:
                     return func(*args, **kwargs)
                 except exception_to_catch as e:
                     last_exception = e
-                    log_level = logging.WARNING if current_attempt < max_attempts else logging.ERROR
-                    # Check against string values of the local ErrorSeverity class
-                    if severity == ErrorSeverity.CRITICAL and current_attempt >= max_attempts :
-                         log_level = logging.CRITICAL
-                    
-                    logger.log(log_level,
-                               f"Attempt {current_attempt}/{max_attempts} for '{func.__name__}' failed: {type(e).__name__} - {e}",
-                               exc_info=(log_level >= logging.ERROR))
-
-                    if current_attempt < max_attempts:
-                        delay = min(initial_delay * (2 ** (current_attempt - 1)), max_delay)
-                        logger.info(f"Retrying '{func.__name__}' in {delay:.2f}s...")
-                        time.sleep(delay)
-                    else: 
-                        if severity == ErrorSeverity.CRITICAL:
-                            logger.critical(f"Critical operation '{func.__name__}' failed definitively after {max_attempts} attempts.")
-                            raise 
-                        logger.error(f"Operation '{func.__name__}' failed after {max_attempts} attempts.")
-                        return None 
-            return None 
         return wrapper
     return decorator
 
@@ -95,7 +111,7 @@ class CircuitBreaker:
         self.failure_count = 0
         self.last_failure_time = 0.0 # Initialize to avoid issues with time.monotonic()
         self.is_open = False
-        self._lock = threading.RLock() # RLock is good practice
+        self._lock = threading.Lock() # Never re-entered; only taken on failures and state changes
         self._logger = logging.getLogger(f"CircuitBreaker.{func_name if (func_name:=getattr(self, '__name__', None)) else id(self)}")
 
 
@@ -104,23 +120,27 @@ class CircuitBreaker:
         
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
-            with self._lock:
-                if self.is_open:
-                    if time.monotonic() - self.last_failure_time > self.recovery_timeout:
-                        self._logger.info(f"Circuit breaker for {func_name_for_logger} is half-open. Allowing one attempt.")
-                        self.is_open = False # Half-open: allow one attempt
-                        # Reset failure_count to allow some retries in half-open state before re-opening fully
-                        # self.failure_count = self.failure_threshold // 2 
-                    else:
-                        self._logger.warning(f"Circuit breaker for {func_name_for_logger} is open. Call rejected.")
-                        raise Exception(f"Circuit for {func_name_for_logger} is open.")
+            # Closed circuit (the normal case) takes no lock: is_open and failure_count
+            # are plain attribute reads, and state changes are re-checked under the lock.
+            if self.is_open:
+                with self._lock:
+                    if self.is_open:
+                        if time.monotonic() - self.last_failure_time > self.recovery_timeout:
+                            self._logger.info("Circuit breaker for %s is half-open. Allowing one attempt.", func_name_for_logger)
+                            self.is_open = False # Half-open: allow one attempt
+                            # Reset failure_count to allow some retries in half-open state before re-opening fully
+                            # self.failure_count = self.failure_threshold // 2 
+                        else:
+                            self._logger.warning("Circuit breaker for %s is open. Call rejected.", func_name_for_logger)
+                            raise Exception(f"Circuit for {func_name_for_logger} is open.")
             try:
                 result = func(*args, **kwargs)
-                with self._lock: 
-                    if self.failure_count > 0 or self.is_open : 
-                         self._logger.info(f"Call to {func_name_for_logger} succeeded. Resetting circuit breaker.")
-                    self.failure_count = 0
-                    self.is_open = False
+                if self.failure_count > 0 or self.is_open:
+                    with self._lock: 
+                        if self.failure_count > 0 or self.is_open : 
+                             self._logger.info("Call to %s succeeded. Resetting circuit breaker.", func_name_for_logger)
+                        self.failure_count = 0
+                        self.is_open = False
                 return result
             except Exception as e:
                 with self._lock:
@@ -128,10 +148,10 @@ class CircuitBreaker:
                     self.last_failure_time = time.monotonic()
                     if self.failure_count >= self.failure_threshold:
                         if not self.is_open: # Log only when it transitions to open
-                            self._logger.error(f"Circuit breaker for {func_name_for_logger} opened due to {self.failure_count} failures.")
+                            self._logger.error("Circuit breaker for %s opened due to %s failures.", func_name_for_logger, self.failure_count)
                         self.is_open = True
                     else:
-                        self._logger.warning(f"Call to {func_name_for_logger} failed ({self.failure_count}/{self.failure_threshold} failures).")
+                        self._logger.warning("Call to %s failed (%s/%s failures).", func_name_for_logger, self.failure_count, self.failure_threshold)
                 raise e # Re-raise the original exception
         return wrapper
 
@@ -1,5 +1,6 @@
 # gui/utils/input_validation.py
 
+import functools
 import logging
 import math
 import re
@@ -7,6 +8,68 @@ import os # Added for os.fspath
 from pathlib import Path
 from typing import Any, Optional, Union
 
+# One logger per validator, looked up once rather than on every call
+_LOG_INTEGER = logging.getLogger('SafeInputValidation.integer')
+_LOG_COLOR_HEX = logging.getLogger('SafeInputValidation.color_hex')
+_LOG_FLOAT = logging.getLogger('SafeInputValidation.float')
+_LOG_STRING = logging.getLogger('SafeInputValidation.string')
+_LOG_BOOLEAN = logging.getLogger('SafeInputValidation.boolean')
+_LOG_PATH_STR = logging.getLogger('SafeInputValidation.path_str')
+
+_HEX_DIGITS = '0123456789abcdef'
+
+def _is_hex_color_digits(digits: str) -> bool:
+    # str.strip() with the digit set leaves nothing behind only if every character
+    # is a hex digit. Unlike int(x, 16) this rejects '+', '-', '_' and whitespace.
+    return len(digits) in (3, 6) and not digits.strip(_HEX_DIGITS)
+
+def _parse_integer(value: Any, min_val: Optional[int], max_val: Optional[int]) -> Optional[int]:
+    """Clamped int for value, None for an empty string; raises on anything unparseable."""
+    if isinstance(value, bool): return int(value)
+    if isinstance(value, str):
+        val_str = value.strip()
+        if not val_str: return None
+        # Handle hex, octal, binary if prefixed (e.g. "0xFF", "0o7", "0b10")
+        # otherwise decimal (can be float string like "123.0")
+        if val_str.startswith(('0x', '0X', '0o', '0O', '0b', '0B')):
+            num_val = int(val_str, 0)
+        else:
+            num_val = int(float(val_str)) # Allows "123.0" but fails "123.4"
+    elif isinstance(value, (int, float)):
+        num_val = int(value)
+    else:
+        raise TypeError(f"Cannot convert type {type(value)} to int")
+
+    if min_val is not None: num_val = max(min_val, num_val)
+    if max_val is not None: num_val = min(max_val, num_val)
+    return num_val
+
+
+def _normalize_color_hex(value: str) -> str:
+    """'#rrggbb' for a 3- or 6-digit hex colour with or without '#'; raises ValueError otherwise."""
+    color_str = value.strip().lower()
+    has_hash = color_str.startswith('#')
+    digits = color_str[1:] if has_hash else color_str
+
+    if not _is_hex_color_digits(digits):
+        raise ValueError("Invalid hex color format" if has_hash
+                         else "Invalid hex color format (no # and not hex chars)")
+
+    if len(digits) == 3:
+        r, g, b = digits
+        return f"#{r}{r}{g}{g}{b}{b}"
+    return color_str if has_hash else '#' + digits
+
+
+# Settings loads and UI refreshes validate the same handful of literals (preset
+# colours, default brightness/speed) over and over, so hashable inputs are memoised.
+# lru_cache never stores a call that raised, so only valid input is cached and every
+# invalid value still reaches the caller's warning. typed=True keeps e.g. 1 and 1.0
+# bounds from sharing an entry.
+_parse_integer_cached = functools.lru_cache(maxsize=256, typed=True)(_parse_integer)
+_normalize_color_hex_cached = functools.lru_cache(maxsize=256)(_normalize_color_hex)
+
+
 class SafeInputValidation:
     """
     Provides methods for safe input validation and sanitization.
@@ -15,36 +78,36 @@ class SafeInputValidation:
     @staticmethod
     def validate_integer(value: Any, min_val: Optional[int] = None, max_val: Optional[int] = None,
                         default: int = 0) -> int:
-        logger = logging.getLogger('SafeInputValidation.integer')
+        logger = _LOG_INTEGER
         try:
-            if isinstance(value, bool): return int(value)
-            if isinstance(value, str):
-                val_str = value.strip()
-                if not val_str: return default
-                # Handle hex, octal, binary if prefixed (e.g. "0xFF", "0o7", "0b10")
-                # otherwise decimal (can be float string like "123.0")
-                if val_str.startswith(('0x', '0X', '0o', '0O', '0b', '0B')):
-                    num_val = int(val_str, 0)
-                else:
-                    num_val = int(float(val_str)) # Allows "123.0" but fails "123.4"
-            elif isinstance(value, (int, float)):
-                num_val = int(value)
+            if type(value) in (int, str):
+                try:
+                    num_val = _parse_integer_cached(value, min_val, max_val)
+                except TypeError: # unhashable bounds
+                    num_val = _parse_integer(value, min_val, max_val)
             else:
-                raise TypeError(f"Cannot convert type {type(value)} to int")
-
-            if min_val is not None: num_val = max(min_val, num_val)
-            if max_val is not None: num_val = min(max_val, num_val)
-            return num_val
+                num_val = _parse_integer(value, min_val, max_val)
         except (ValueError, TypeError, OverflowError) as e:
-            logger.warning(f"Invalid integer input '{value}': {e}. Using default: {default}")
+            logger.warning("Invalid integer input '%s': %s. Using default: %s", value, e, default)
             if min_val is not None: default = max(min_val, default)
             if max_val is not None: default = min(max_val, default)
             return default
+        return default if num_val is None else num_val
+
+    @staticmethod
+    def clamp_int(value: Any, min_val: int, max_val: int, default: int) -> int:
+        """
+        Clamp an int to [min_val, max_val]. Plain ints (what JSON loads and sliders
+        produce) are clamped inline; anything else goes through validate_integer.
+        """
+        if type(value) is int:
+            return min_val if value < min_val else max_val if value > max_val else value
+        return SafeInputValidation.validate_integer(value, min_val, max_val, default)
 
     @staticmethod
     def validate_float(value: Any, min_val: Optional[float] = None, max_val: Optional[float] = None,
                       default: float = 0.0) -> float:
-        logger = logging.getLogger('SafeInputValidation.float')
+        logger = _LOG_FLOAT
         try:
             if isinstance(value, bool): return float(value)
             if isinstance(value, str):
@@ -57,14 +120,14 @@ class SafeInputValidation:
                 raise TypeError(f"Cannot convert type {type(value)} to float")
 
             if not math.isfinite(num_val):
-                logger.warning(f"Invalid float input (NaN/Inf) '{value}'. Using default: {default}")
+                logger.warning("Invalid float input (NaN/Inf) '%s'. Using default: %s", value, default)
                 return default
             
             if min_val is not None: num_val = max(min_val, num_val)
             if max_val is not None: num_val = min(max_val, num_val)
             return num_val
         except (ValueError, TypeError, OverflowError) as e:
-            logger.warning(f"Invalid float input '{value}': {e}. Using default: {default}")
+            logger.warning("Invalid float input '%s': %s. Using default: %s", value, e, default)
             if min_val is not None: default = max(min_val, default)
             if max_val is not None: default = min(max_val, default)
             return default
@@ -72,7 +135,7 @@ class SafeInputValidation:
     @staticmethod
     def validate_string(value: Any, max_length: int = 1000, 
                        allowed_chars_re: Optional[str] = None, default: str = "") -> str:
-        logger = logging.getLogger('SafeInputValidation.string')
+        logger = _LOG_STRING
         try:
             if value is None: return default
             
@@ -81,7 +144,7 @@ class SafeInputValidation:
 
             if len(result) > max_length:
                 result = result[:max_length]
-                logger.info(f"String input truncated to {max_length} characters.")
+                logger.info("String input truncated to %s characters.", max_length)
             
             if allowed_chars_re:
                 # Ensure it's a valid regex pattern
@@ -89,42 +152,30 @@ class SafeInputValidation:
                     compiled_re = re.compile(allowed_chars_re)
                     result = "".join(compiled_re.findall(result))
                 except re.error as re_err:
-                    logger.warning(f"Invalid regex for allowed_chars_re '{allowed_chars_re}': {re_err}. Not filtering.")
+                    logger.warning("Invalid regex for allowed_chars_re '%s': %s. Not filtering.", allowed_chars_re, re_err)
             
             return result
         except Exception as e:
-            logger.warning(f"Invalid string input processing for '{value}': {e}. Using default: '{default}'")
+            logger.warning("Invalid string input processing for '%s': %s. Using default: '%s'", value, e, default)
             return default
 
     @staticmethod
     def validate_color_hex(value: Any, default: str = "#000000") -> str:
-        logger = logging.getLogger('SafeInputValidation.color_hex')
+        logger = _LOG_COLOR_HEX
+        if value is None: return default
         try:
-            if value is None: return default
-            
-            color_str = str(value).strip().lower()
-            
-            if not color_str.startswith('#'):
-                if re.fullmatch(r'[0-9a-f]{3}(?:[0-9a-f]{3})?', color_str): # Match 3 or 6 hex chars
-                    color_str = '#' + color_str
-                else:
-                    logger.warning(f"Invalid hex color format (no # and not hex chars) '{value}'. Using default: {default}")
-                    return default
-
-            if re.fullmatch(r'#[0-9a-f]{3}', color_str):
-                return '#' + ''.join(c*2 for c in color_str[1:])
-            elif re.fullmatch(r'#[0-9a-f]{6}', color_str):
-                return color_str
-            else:
-                logger.warning(f"Invalid hex color format '{value}'. Using default: {default}")
-                return default
+            if type(value) is str:
+                return _normalize_color_hex_cached(value)
+            return _normalize_color_hex(str(value))
+        except ValueError as e:
+            logger.warning("%s '%s'. Using default: %s", e, value, default)
         except Exception as e:
-            logger.warning(f"Error validating hex color '{value}': {e}. Using default: {default}")
-            return default
+            logger.warning("Error validating hex color '%s': %s. Using default: %s", value, e, default)
+        return default
 
     @staticmethod
     def validate_bool(value: Any, default: bool = False) -> bool:
-        logger = logging.getLogger('SafeInputValidation.boolean')
+        logger = _LOG_BOOLEAN
         if isinstance(value, bool):
             return value
         if isinstance(value, (int, float)):
@@ -135,14 +186,14 @@ class SafeInputValidation:
                 return True
             if val_lower in ['false', 'no', '0', 'off', 'f', 'n']:
                 return False
-        logger.warning(f"Could not interpret '{value}' (type: {type(value)}) as boolean. Using default: {default}")
+        logger.warning("Could not interpret '%s' (type: %s) as boolean. Using default: %s", value, type(value), default)
         return default
 
     @staticmethod
     def validate_path_str(value: Any, must_exist: bool = False, 
                      create_if_not_exist: bool = False,
                      must_be_dir: bool = False, default_str: Optional[str] = None) -> Optional[str]:
-        logger = logging.getLogger('SafeInputValidation.path_str')
+        logger = _LOG_PATH_STR
         try:
             if value is None: return default_str
             
@@ -150,42 +201,42 @@ class SafeInputValidation:
                 # os.fspath handles Path-like objects as well as strings
                 path_obj = Path(os.fspath(value)).resolve()
             except (TypeError, ValueError) as e:
-                logger.warning(f"Invalid input type for path '{value}': {e}")
+                logger.warning("Invalid input type for path '%s': %s", value, e)
                 return default_str
 
             # Basic security check for excessive parent directory traversals.
             # This is a simple heuristic. More robust checks might be needed for specific use cases.
             if str(path_obj).count("..") > 4: # Allowing a few '..' for relative paths within project
-                 logger.warning(f"Path '{path_obj}' contains many '..' components. Please verify path validity.")
+                 logger.warning("Path '%s' contains many '..' components. Please verify path validity.", path_obj)
                  # Depending on security policy, could return default_str or raise an error here.
 
             if create_if_not_exist and not path_obj.exists():
                 try:
                     if must_be_dir:
                         path_obj.mkdir(parents=True, exist_ok=True)
-                        logger.info(f"Created directory: {path_obj}")
+                        logger.info("Created directory: %s", path_obj)
                     else: # For a file path, ensure its parent directory exists
                         path_obj.parent.mkdir(parents=True, exist_ok=True)
-                        logger.info(f"Ensured parent directory exists for: {path_obj}")
+                        logger.info("Ensured parent directory exists for: %s", path_obj)
                 except OSError as os_e:
-                    logger.error(f"Could not create path or parent for '{path_obj}': {os_e}")
+                    logger.error("Could not create path or parent for '%s': %s", path_obj, os_e)
                     return default_str # Failed to create
 
             if must_exist and not path_obj.exists():
-                logger.debug(f"Path '{path_obj}' must exist but doesn't.")
+                logger.debug("Path '%s' must exist but doesn't.", path_obj)
                 return default_str
             
             if path_obj.exists(): # Only check type if it exists
                 if must_be_dir and not path_obj.is_dir():
-                    logger.debug(f"Path '{path_obj}' must be a directory but is a file.")
+                    logger.debug("Path '%s' must be a directory but is a file.", path_obj)
                     return default_str
                 # If it must be a file (not a dir), and it exists and is a dir
                 if not must_be_dir and path_obj.is_dir() and must_exist: 
-                    logger.debug(f"Path '{path_obj}' must be a file but is a directory.")
+                    logger.debug("Path '%s' must be a file but is a directory.", path_obj)
                     return default_str
             return str(path_obj)
             
         except Exception as e:
-            logger.warning(f"Path validation error for '{value}': {e}. Using default: {default_str}", exc_info=True)
+            logger.warning("Path validation error for '%s': %s. Using default: %s", value, e, default_str, exc_info=True)
             return default_str
 
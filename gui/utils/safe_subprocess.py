@@ -3,13 +3,22 @@
 
 import subprocess
 import logging
+import os
+import select
 import shlex 
 import re # <<< Added missing import 're'
+import threading
+import time
 from typing import List, Tuple, Optional, Union 
 
 from ..core.exceptions import SecurityError, HardwareError, ResourceError
 from .decorators import safe_execute
 
+_logger = logging.getLogger('SafeSubprocess.run_command')
+
+# Shell metacharacters (plus newline/CR/NUL) flagged in arguments, compiled once
+_DANGEROUS_CHARS_RE = re.compile(r"[;&|<>`$()\n\r\x00]")
+
 def run_command(cmd: List[str], 
                 timeout: float = 5.0, 
                 check: bool = False, 
@@ -20,7 +29,7 @@ def run_command(cmd: List[str],
     Run a command safely without shell injection risks.
     Manages timeouts, captures output, and logs errors.
     """
-    logger = logging.getLogger('SafeSubprocess.run_command')
+    logger = _logger
 
     if not cmd or not isinstance(cmd, list):
         logger.error("Invalid command format: Command must be a non-empty list.")
@@ -29,25 +38,24 @@ def run_command(cmd: List[str],
     sanitized_cmd: List[str] = []
     for i, arg in enumerate(cmd):
         if not isinstance(arg, (str, bytes)):
-            logger.error(f"Invalid command argument type at index {i}: {type(arg)}. Must be str or bytes.")
+            logger.error("Invalid command argument type at index %s: %s. Must be str or bytes.", i, type(arg))
             raise SecurityError(f"Invalid command argument type at index {i}: {type(arg)}.")
         if isinstance(arg, bytes):
             try:
                 sanitized_cmd.append(arg.decode('utf-8', errors='strict'))
             except UnicodeDecodeError:
-                logger.error(f"Command argument at index {i} is bytes but not valid UTF-8.")
+                logger.error("Command argument at index %s is bytes but not valid UTF-8.", i)
                 raise SecurityError(f"Non-UTF8 byte string in command argument at index {i}.")
         else: 
             sanitized_cmd.append(arg)
 
     if not all(s.strip() for s in sanitized_cmd):
-        logger.error(f"Command contains empty or whitespace-only arguments: {sanitized_cmd}")
+        logger.error("Command contains empty or whitespace-only arguments: %s", sanitized_cmd)
         raise SecurityError("Command arguments cannot be empty or solely whitespace.")
 
-    dangerous_chars_pattern = re.compile(r"[;&|<>`$()]")
     for arg_str in sanitized_cmd:
-        if dangerous_chars_pattern.search(arg_str):
-            logger.warning(f"Potentially problematic characters found in command argument: '{arg_str}'")
+        if _DANGEROUS_CHARS_RE.search(arg_str):
+            logger.warning("Potentially problematic characters found in command argument: '%s'", arg_str)
 
     processed_input: Optional[Union[str,bytes]] = None
     if input_data is not None:
@@ -66,13 +74,14 @@ def run_command(cmd: List[str],
             if isinstance(input_data, str):
                 processed_input = input_data.encode('utf-8')
             elif not isinstance(input_data, bytes):
-                logger.error(f"Input data for binary mode is not bytes or str: {type(input_data)}")
+                logger.error("Input data for binary mode is not bytes or str: %s", type(input_data))
                 raise ValueError("Invalid input_data type for binary mode (expected bytes or str).")
             else:
                 processed_input = input_data
 
-    cmd_display = ' '.join(shlex.quote(s) for s in sanitized_cmd)
-    logger.debug(f"Executing command: {cmd_display[:250]}{'...' if len(cmd_display)>250 else ''} (Timeout: {timeout}s)")
+    if logger.isEnabledFor(logging.DEBUG): # Skip quoting/joining the command when debug is off
+        cmd_display = ' '.join(shlex.quote(s) for s in sanitized_cmd)
+        logger.debug("Executing command: %s%s (Timeout: %ss)", cmd_display[:250], '...' if len(cmd_display) > 250 else '', timeout)
 
     try:
         result = subprocess.run(
@@ -85,20 +94,168 @@ def run_command(cmd: List[str],
             shell=False     
         )
         if result.returncode != 0 and not check: 
-             logger.warning(f"Command '{sanitized_cmd[0]}' exited with code {result.returncode}. Stderr: '{result.stderr.strip()[:200] if result.stderr else ''}'")
-        elif result.returncode == 0:
-             logger.debug(f"Command '{sanitized_cmd[0]}' completed successfully. Stdout: '{result.stdout.strip()[:100] if result.stdout else ''}'")
+             logger.warning("Command '%s' exited with code %s. Stderr: '%s'", sanitized_cmd[0], result.returncode, result.stderr.strip()[:200] if result.stderr else '')
+        elif result.returncode == 0 and logger.isEnabledFor(logging.DEBUG):
+             logger.debug("Command '%s' completed successfully. Stdout: '%s'", sanitized_cmd[0], result.stdout.strip()[:100] if result.stdout else '')
         return result
         
     except subprocess.TimeoutExpired as e:
-        logger.error(f"Command '{sanitized_cmd[0]}' timed out after {timeout} seconds.", exc_info=True)
+        logger.error("Command '%s' timed out after %s seconds.", sanitized_cmd[0], timeout, exc_info=True)
         raise HardwareError(f"Command '{sanitized_cmd[0]}' timed out: {e}") from e
     except subprocess.CalledProcessError as e: 
-        logger.error(f"Command '{sanitized_cmd[0]}' failed with return code {e.returncode}. Stderr: {e.stderr.strip() if e.stderr else 'N/A'}", exc_info=True)
+        logger.error("Command '%s' failed with return code %s. Stderr: %s", sanitized_cmd[0], e.returncode, e.stderr.strip() if e.stderr else 'N/A', exc_info=True)
         raise HardwareError(f"Command '{sanitized_cmd[0]}' failed: {e}") from e
     except FileNotFoundError as e: 
-        logger.error(f"Command executable not found: '{sanitized_cmd[0]}'. Error: {e}", exc_info=True)
+        logger.error("Command executable not found: '%s'. Error: %s", sanitized_cmd[0], e, exc_info=True)
         raise ResourceError(f"Executable '{sanitized_cmd[0]}' not found.") from e
     except Exception as e: 
-        logger.critical(f"Unexpected OS error running command '{sanitized_cmd[0]}': {e}", exc_info=True)
+        logger.critical("Unexpected OS error running command '%s': %s", sanitized_cmd[0], e, exc_info=True)
         raise HardwareError(f"Unexpected OS error during command execution: {e}") from e
+
+
+_BATCH_SEPARATOR = '__BATCH_RC__'
+
+def run_batch(commands: List[List[str]], timeout: float = 5.0) -> List[Tuple[int, str]]:
+    """
+    Run several commands through a single '/bin/sh -c' invocation.
+    Each command's arguments are shell-quoted; output is split on a sentinel line
+    carrying the exit code, so the caller gets one (returncode, stdout) per command
+    for the cost of a single fork/exec.
+    """
+    logger = _logger
+    if not commands:
+        return []
+    for cmd in commands:
+        if not cmd or not isinstance(cmd, list) or not all(isinstance(a, str) and a.strip() for a in cmd):
+            logger.error("Invalid command in batch: %r", cmd)
+            raise SecurityError("Invalid command format in batch: each command must be a non-empty list of non-empty strings.")
+
+    script = ''.join(f"{shlex.join(cmd)} 2>&1; echo {_BATCH_SEPARATOR} $?\n" for cmd in commands)
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug("Executing batch of %d commands (Timeout: %ss)", len(commands), timeout)
+
+    try:
+        result = subprocess.run(['/bin/sh', '-c', script], capture_output=True, text=True,
+                                timeout=timeout, shell=False)
+    except subprocess.TimeoutExpired as e:
+        logger.error("Command batch timed out after %s seconds.", timeout, exc_info=True)
+        raise HardwareError(f"Command batch timed out: {e}") from e
+    except OSError as e:
+        logger.critical("Unexpected OS error running command batch: %s", e, exc_info=True)
+        raise HardwareError(f"Unexpected OS error during command batch execution: {e}") from e
+
+    results: List[Tuple[int, str]] = []
+    output_lines: List[str] = []
+    for line in result.stdout.splitlines():
+        if line.startswith(_BATCH_SEPARATOR):
+            try:
+                rc = int(line[len(_BATCH_SEPARATOR):])
+            except ValueError:
+                rc = -1
+            results.append((rc, '\n'.join(output_lines)))
+            output_lines = []
+        else:
+            output_lines.append(line)
+    if len(results) != len(commands):
+        # The shell died part-way through; report the rest as failed
+        logger.warning("Command batch returned %s of %s results.", len(results), len(commands))
+        results.extend((-1, '') for _ in range(len(commands) - len(results)))
+    return results
+
+
+class EctoolSession:
+    """
+    Long-lived shell child that runs ectool command lines fed over its stdin.
+
+    ectool has no interactive mode, so every command is still one exec of ectool,
+    but the Python side stops forking a fresh subprocess per command: a whole batch
+    goes out as one pipe write and exit codes come back as sentinel lines.
+    """
+    _SENTINEL = b'__ECTOOL_RC__'
+    _LINE_SUFFIX = b' >/dev/null 2>&1; echo ' + _SENTINEL + b' $?\n'
+    # Arguments made only of these characters need no shell quoting (same set shlex.quote leaves alone)
+    _PLAIN_ARG_RE = re.compile(rb'[\w@%+=:,./-]+', re.ASCII)
+
+    def __init__(self, ectool_path: str, timeout: float = 5.0):
+        self.ectool_path = ectool_path
+        self.timeout = timeout
+        self._proc: Optional[subprocess.Popen] = None
+        self._buffer = b''
+        self._lock = threading.Lock()
+        self._cached_path: Optional[str] = None # ectool_path that _path_bytes was quoted from
+        self._path_bytes = b''
+        self._logger = logging.getLogger('SafeSubprocess.EctoolSession')
+
+    def _ensure_started(self) -> subprocess.Popen:
+        if self._proc is None or self._proc.poll() is not None:
+            self._buffer = b''
+            self._proc = subprocess.Popen(['/bin/sh'], stdin=subprocess.PIPE, stdout=subprocess.PIPE,
+                                          stderr=subprocess.DEVNULL, shell=False)
+            self._logger.debug("Started ectool session shell (pid %s)", self._proc.pid)
+        return self._proc
+
+    def _read_line(self, proc: subprocess.Popen, deadline: float) -> bytes:
+        fd = proc.stdout.fileno()
+        while b'\n' not in self._buffer:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise HardwareError("ectool session timed out waiting for command results")
+            ready, _, _ = select.select([fd], [], [], remaining)
+            if ready:
+                chunk = os.read(fd, 4096)
+                if not chunk:
+                    raise HardwareError("ectool session shell exited unexpectedly")
+                self._buffer += chunk
+        line, self._buffer = self._buffer.split(b'\n', 1)
+        return line
+
+    def send_batch(self, commands: List[List[str]]) -> List[bool]:
+        """Run each argument list as 'ectool <args>'; returns per-command success."""
+        if not commands:
+            return []
+        payload = b''.join(self._command_line(args) for args in commands)
+        with self._lock:
+            try:
+                proc = self._ensure_started()
+                proc.stdin.write(payload)
+                proc.stdin.flush()
+                deadline = time.monotonic() + self.timeout
+                results = []
+                for _ in commands:
+                    line = self._read_line(proc, deadline)
+                    while not line.startswith(self._SENTINEL):
+                        line = self._read_line(proc, deadline)
+                    results.append(line[len(self._SENTINEL):].strip() == b'0')
+                return results
+            except (OSError, ValueError, HardwareError) as e:
+                # Output may be out of step with the commands now; start clean next time
+                self._close_locked()
+                if isinstance(e, HardwareError):
+                    raise
+                raise HardwareError(f"ectool session failed: {e}") from e
+
+    def _command_line(self, args: List[str]) -> bytes:
+        # rgbkbd frames are all plain tokens (numbers, 0xRRGGBB): join the bytes directly
+        # and only fall back to shlex quoting for anything unusual
+        if self._cached_path != self.ectool_path:
+            self._cached_path = self.ectool_path
+            self._path_bytes = shlex.quote(self.ectool_path).encode('utf-8')
+        encoded = [arg.encode('utf-8') for arg in args]
+        plain = self._PLAIN_ARG_RE.fullmatch
+        if all(plain(arg) for arg in encoded):
+            return b' '.join([self._path_bytes] + encoded) + self._LINE_SUFFIX
+        return shlex.join([self.ectool_path] + list(args)).encode('utf-8') + self._LINE_SUFFIX
+
+    def _close_locked(self):
+        proc, self._proc = self._proc, None
+        self._buffer = b''
+        if proc is not None:
+            try:
+                proc.kill()
+                proc.wait(timeout=1.0)
+            except Exception:
+                pass
+
+    def close(self):
+        with self._lock:
+            self._close_locked()
@@ -14,6 +14,9 @@ import traceback # Added import
 try:
     import psutil
     PSUTIL_AVAILABLE = True
+    # Prime the CPU counters so later cpu_times_percent(interval=None) calls return
+    # usage since the previous call instead of sleeping to take a sample
+    psutil.cpu_times_percent(interval=None, percpu=False)
 except ImportError:
     PSUTIL_AVAILABLE = False
 
@@ -68,7 +71,7 @@ def get_system_info_list() -> List[str]:
             mem = psutil.virtual_memory()
             info_parts.append(f"Memory: Total {mem.total/(1024**3):.2f}GB, Available {mem.available/(1024**3):.2f}GB, Used {mem.percent}%")
             
-            cpu_times = psutil.cpu_times_percent(interval=0.1, percpu=False)
+            cpu_times = psutil.cpu_times_percent(interval=None, percpu=False) # Non-blocking; primed at import
             info_parts.append(f"CPU Usage: User {cpu_times.user}%, System {cpu_times.system}%, Idle {cpu_times.idle}%")
             info_parts.append(f"CPU Cores: Logical {psutil.cpu_count(logical=True)}, Physical {psutil.cpu_count(logical=False)}")
             